@@ -1,29 +1,87 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import asyncio
+import atexit
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Dict, Any
 
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+from redcalibur.cache import (
+    response_cache,
+    make_cache_key,
+    TTL_DNS,
+    TTL_WHOIS,
+    TTL_SCAN,
+    TTL_URLSCAN,
+)
 from redcalibur.config import Config, setup_logging
+from redcalibur.http import aclose_client
 from redcalibur.osint.domain_infrastructure.whois_lookup import perform_whois_lookup
 from redcalibur.osint.domain_infrastructure.dns_enumeration import enumerate_dns_records
 from redcalibur.osint.domain_infrastructure.subdomain_discovery import discover_subdomains
-from redcalibur.osint.domain_infrastructure.port_scanning import perform_port_scan
+from redcalibur.osint.domain_infrastructure.port_scanning_async import perform_port_scan_async
 from redcalibur.osint.domain_infrastructure.ssl_tls_details import get_ssl_details
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
-import time
 from redcalibur.osint.network_threat_intel.shodan_integration import perform_shodan_scan
 from redcalibur.osint.user_identity.username_lookup import lookup_username
-from redcalibur.osint.virustotal_integration import scan_url
+from redcalibur.osint.virustotal_integration import scan_url_async
 from redcalibur.osint.url_health_check import basic_url_health
-from redcalibur.osint.ai_enhanced.recon_summarizer import summarize_recon_data
+from redcalibur.osint.ai_enhanced.recon_summarizer import (
+    summarize_recon_data,
+    summarize_recon_data_stream,
+)
 from redcalibur.osint.ai_enhanced.risk_scoring import calculate_risk_score
 
 logger = setup_logging()
 config = Config()
 
-app = FastAPI(title="RedCalibur API", version="0.1.0")
+# One bounded pool for all blocking recon work; creating/tearing down an
+# executor per request costs time and leaks threads under cancellation races.
+_EXEC = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RC_WORKERS", "16")), thread_name_prefix="rc"
+)
+atexit.register(_EXEC.shutdown, wait=False)
+
+
+def run_blocking(fn, *args):
+    """Schedule a blocking call on the shared pool from the event loop."""
+    return asyncio.get_running_loop().run_in_executor(_EXEC, fn, *args)
+
+
+# Backpressure: bound the heavy fan-out endpoints so a burst can't starve
+# the shared pool (and with it /health) — excess requests queue on the loop.
+DOMAIN_SEM = asyncio.Semaphore(int(os.getenv("RC_DOMAIN_CONC", "8")))
+VT_SEM = asyncio.Semaphore(int(os.getenv("RC_VT_CONC", "4")))
+SCAN_SEM = asyncio.Semaphore(int(os.getenv("RC_SCAN_CONC", "8")))
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
+# /health and / are hit constantly by probes; re-render the timestamp at
+# most every 100ms instead of allocating a datetime per request.
+_ts_cache = [0.0, ""]
+
+
+def _now_iso_cached() -> str:
+    t = time.time()
+    if t - _ts_cache[0] > 0.1:
+        _ts_cache[0] = t
+        _ts_cache[1] = _now_iso()
+    return _ts_cache[1]
+
+app = FastAPI(title="RedCalibur API", version="0.1.0", default_response_class=ORJSONResponse)
+
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await aclose_client()
 
 # CORS configuration for production
 allowed_origins = [
@@ -43,7 +101,12 @@ app.add_middleware(
 )
 
 
-class DomainRequest(BaseModel):
+class APIRequest(BaseModel):
+    """Base for request models: skip unknown keys, no post-init mutation."""
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True, frozen=True)
+
+
+class DomainRequest(APIRequest):
     target: str
     whois: bool = False
     dns: bool = False
@@ -52,104 +115,89 @@ class DomainRequest(BaseModel):
     all: bool = False
 
 
-class ScanRequest(BaseModel):
+class ScanRequest(APIRequest):
     target: str
     ports: Optional[List[int]] = None
     shodan: bool = False
 
 
-class UsernameRequest(BaseModel):
+class UsernameRequest(APIRequest):
     target: str
     platforms: Optional[List[str]] = None
 
 
-class URLScanRequest(BaseModel):
+class URLScanRequest(APIRequest):
     url: str
 
 
 @app.get("/")
 def root() -> Dict[str, Any]:
-    return {"message": "RedCalibur API", "status": "ok", "time": datetime.now().isoformat()}
+    return {"message": "RedCalibur API", "status": "ok", "time": _now_iso_cached()}
 
 @app.get("/health")
 def health() -> Dict[str, Any]:
-    return {"status": "ok", "time": datetime.now().isoformat()}
+    return {"status": "ok", "time": _now_iso_cached()}
 
 
 @app.post("/domain")
-def domain_recon(req: DomainRequest):
-    results: Dict[str, Any] = {"target": req.target, "timestamp": datetime.now().isoformat()}
+async def domain_recon(req: DomainRequest):
+    results: Dict[str, Any] = {"target": req.target, "timestamp": _now_iso()}
     errors: Dict[str, Any] = {}
 
-    tasks = []
-
-    def wrap(name, fn, *args, **kwargs):
-        try:
-            res = fn(*args, **kwargs)
-            results[name] = res
-        except Exception as e:
-            logger.error(f"{name} error: {e}")
-            errors[name] = str(e)
-
-    ex = ThreadPoolExecutor(max_workers=4)
-    try:
-        fut_to_name: Dict[Any, str] = {}
-        if req.whois or req.all:
-            fut = ex.submit(wrap, "whois", perform_whois_lookup, req.target)
-            tasks.append(fut)
-            fut_to_name[fut] = "whois"
-        if req.dns or req.all:
-            fut = ex.submit(wrap, "dns", enumerate_dns_records, req.target)
-            tasks.append(fut)
-            fut_to_name[fut] = "dns"
-        if req.subdomains or req.all:
-            fut = ex.submit(wrap, "subdomains", discover_subdomains, req.target, config.SUBDOMAIN_WORDLIST)
-            tasks.append(fut)
-            fut_to_name[fut] = "subdomains"
-        if req.ssl or req.all:
-            fut = ex.submit(wrap, "ssl", get_ssl_details, req.target)
-            tasks.append(fut)
-            fut_to_name[fut] = "ssl"
-
-        deadline = time.time() + 12.0
-        pending = set(tasks)
-        while time.time() < deadline and pending:
-            try:
-                for fut in as_completed(list(pending), timeout=0.5):
-                    try:
-                        fut.result()
-                    except Exception as e:
-                        logger.error(f"Task future error: {e}")
-                    finally:
-                        pending.discard(fut)
-            except TimeoutError:
-                # No futures completed in this slice; loop again until deadline
-                pass
-
-        # Mark any remaining as timed out by task name
-        for fut in list(pending):
-            name = fut_to_name.get(fut, "task")
-            errors[name] = "timeout"
-    finally:
-        # Do not wait for running tasks; return partial results promptly
-        ex.shutdown(wait=False, cancel_futures=True)
+    # Fan out the blocking recon helpers onto threads and await them together;
+    # each task gets its own timeout so one slow lookup can't stall the rest.
+    # Results are served from the TTL cache when the target was seen recently.
+    def cached_task(name, ttl, timeout, fn, *args):
+        key = make_cache_key(name, target=req.target)
+        return response_cache.get_or_compute(
+            key, ttl, lambda: asyncio.wait_for(run_blocking(fn, *args), timeout)
+        )
+
+    coros: Dict[str, Any] = {}
+    if req.whois or req.all:
+        coros["whois"] = cached_task("whois", TTL_WHOIS, 8.0, perform_whois_lookup, req.target)
+    if req.dns or req.all:
+        coros["dns"] = cached_task("dns", TTL_DNS, 8.0, enumerate_dns_records, req.target)
+    if req.subdomains or req.all:
+        coros["subdomains"] = cached_task(
+            "subdomains", TTL_DNS, 12.0, discover_subdomains, req.target, config.SUBDOMAIN_WORDLIST
+        )
+    if req.ssl or req.all:
+        coros["ssl"] = cached_task("ssl", TTL_DNS, 8.0, get_ssl_details, req.target)
+
+    if coros:
+        async with DOMAIN_SEM:
+            done = await asyncio.gather(*coros.values(), return_exceptions=True)
+        for name, res in zip(coros.keys(), done):
+            if isinstance(res, asyncio.TimeoutError):
+                errors[name] = "timeout"
+            elif isinstance(res, Exception):
+                logger.error(f"{name} error: {res}")
+                errors[name] = str(res)
+            else:
+                results[name] = res
 
     # AI enrichment (optional)
     if req.all:
         try:
-            import json
-            raw_data = json.dumps(results, indent=2, default=str)
-            # Run summarization with a strict timeout to avoid long external calls
-            ex_ai = ThreadPoolExecutor(max_workers=1)
-            try:
-                fut = ex_ai.submit(summarize_recon_data, raw_data[:2000])
+            # Dead targets (NXDOMAIN, all timeouts) have nothing worth a
+            # multi-second LLM call — return a stub summary immediately.
+            informative = any(
+                isinstance(results.get(k), (list, dict)) and results.get(k)
+                for k in ("dns", "subdomains", "ssl", "whois")
+            )
+            if not informative:
+                results["ai_summary"] = "No reconnaissance data gathered."
+            else:
+                # No pretty-printing: the payload is only truncated and fed to the LLM
+                raw_data = orjson.dumps(results, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+                # Run summarization with a strict timeout to avoid long external calls
                 try:
-                    results["ai_summary"] = fut.result(timeout=6.0)
-                except TimeoutError:
+                    results["ai_summary"] = await asyncio.wait_for(
+                        run_blocking(summarize_recon_data, raw_data[:2000]), 6.0
+                    )
+                except asyncio.TimeoutError:
                     errors["ai"] = "timeout"
-            finally:
-                # Don't wait for the AI call to finish if it's slow
-                ex_ai.shutdown(wait=False, cancel_futures=True)
 
             # Risk scoring is local and fast
             features = [
@@ -168,20 +216,26 @@ def domain_recon(req: DomainRequest):
 
 
 @app.post("/scan")
-def scan(req: ScanRequest):
-    results: Dict[str, Any] = {"target": req.target, "timestamp": datetime.now().isoformat()}
-    try:
-        ports = req.ports or config.DEFAULT_PORTS
-        results["port_scan"] = perform_port_scan(req.target, ports)
+async def scan(req: ScanRequest):
+    ports = req.ports or config.DEFAULT_PORTS
+
+    async def compute():
+        results: Dict[str, Any] = {"target": req.target, "timestamp": _now_iso()}
+        async with SCAN_SEM:
+            results["port_scan"] = await perform_port_scan_async(req.target, ports)
         if req.shodan:
             if not config.SHODAN_API_KEY:
                 results["shodan_error"] = "SHODAN_API_KEY not configured"
             else:
-                results["shodan"] = perform_shodan_scan(config.SHODAN_API_KEY, req.target)
+                results["shodan"] = await run_blocking(perform_shodan_scan, config.SHODAN_API_KEY, req.target)
+        return results
+
+    try:
+        key = make_cache_key("scan", target=req.target, ports=ports, shodan=req.shodan)
+        return await response_cache.get_or_compute(key, TTL_SCAN, compute)
     except Exception as e:
         logger.error(f"Scan failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    return results
 
 
 @app.post("/username")
@@ -190,7 +244,7 @@ def username(req: UsernameRequest):
         platforms = req.platforms or ["twitter", "linkedin", "github", "instagram"]
         return {
             "target": req.target,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "username_lookup": lookup_username(req.target, platforms),
         }
     except Exception as e:
@@ -199,37 +253,47 @@ def username(req: UsernameRequest):
 
 
 @app.post("/urlscan")
-def urlscan(req: URLScanRequest):
+async def urlscan(req: URLScanRequest):
     try:
-        # Run the scan in a short-lived thread with a strict timeout
-        def runner():
-            if not config.VIRUSTOTAL_API_KEY:
-                return {"note": "VIRUSTOTAL_API_KEY not configured", "health": basic_url_health(req.url)}
-            return scan_url(config.VIRUSTOTAL_API_KEY, req.url) or {"error": "no_data"}
-
-        with ThreadPoolExecutor(max_workers=1) as ex_url:
-            fut = ex_url.submit(runner)
-            try:
-                return fut.result(timeout=10.0)
-            except TimeoutError:
-                return {"error": "timeout"}
-            finally:
-                ex_url.shutdown(wait=False, cancel_futures=True)
+        # VirusTotal goes over the shared pooled client; the keyless health
+        # fallback still runs on a thread.
+        async def compute():
+            async with VT_SEM:
+                if not config.VIRUSTOTAL_API_KEY:
+                    health = await run_blocking(basic_url_health, req.url)
+                    return {"note": "VIRUSTOTAL_API_KEY not configured", "health": health}
+                return await scan_url_async(config.VIRUSTOTAL_API_KEY, req.url) or {"error": "no_data"}
+
+        key = make_cache_key("urlscan", url=req.url)
+        try:
+            return await response_cache.get_or_compute(
+                key, TTL_URLSCAN, lambda: asyncio.wait_for(compute(), 10.0)
+            )
+        except asyncio.TimeoutError:
+            return {"error": "timeout"}
     except Exception as e:
         logger.error(f"URL scan failed: {e}")
         return {"error": str(e)}
 
 
-class SummarizeRequest(BaseModel):
-    payload: Dict[str, Any]
+class SummarizeRequest(APIRequest):
+    # Any skips recursive dict validation; the payload is only re-serialized
+    payload: Any = Field(default_factory=dict)
 
 
 @app.post("/summarize")
 def summarize(req: SummarizeRequest):
     try:
-        import json
-        raw = json.dumps(req.payload, indent=2, default=str)
+        raw = orjson.dumps(req.payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
         return {"summary": summarize_recon_data(raw[:4000])}
     except Exception as e:
         logger.error(f"Summarize failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/summarize/stream")
+def summarize_stream(req: SummarizeRequest):
+    # Chunks reach the client at time-to-first-token; the sync generator is
+    # iterated on Starlette's threadpool.
+    raw = orjson.dumps(req.payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return StreamingResponse(summarize_recon_data_stream(raw[:4000]), media_type="text/plain")
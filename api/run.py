@@ -1,11 +1,19 @@
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
     # For local dev, binding to all interfaces is OK.
     # For CI, suppress Bandit warning.
+    # Set RELOAD=1 for dev auto-reload; reload forces a single worker,
+    # so production runs multi-worker with uvloop + httptools instead.
+    reload = bool(os.getenv("RELOAD"))
     uvicorn.run(
         "api.app:app",
         host="0.0.0.0",  # nosec
         port=8000,
-        reload=True
-    )
\ No newline at end of file
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("RC_WEB_WORKERS", "1" if reload else "4")),
+        reload=reload,
+    )
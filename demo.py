@@ -15,7 +15,7 @@ import os
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from redcalibur.phishing_detection import AIPhishingDetector, create_sample_dataset
+from redcalibur.phishing_detection import AIPhishingDetector, create_sample_dataset, DEFAULT_MODEL_PATH
 
 def main():
     parser = argparse.ArgumentParser(
@@ -55,6 +55,8 @@ def main():
             
             print("🎯 Training neural networks...")
             detector.train_neural_network(urls, labels, epochs=50)
+            detector.save(DEFAULT_MODEL_PATH)
+            print(f"💾 Models saved to {DEFAULT_MODEL_PATH}")
             
             if args.demo or args.simple:
                 test_urls = [
@@ -82,11 +84,19 @@ def main():
         elif args.url:
             print(f"🔍 Analyzing: {args.url}")
             
-            # Train a quick model first
-            print("📊 Training models with sample data...")
-            urls, labels = create_sample_dataset()
-            detector.train_neural_network(urls, labels, epochs=30)
-            
+            # Reuse saved models when available; retraining per invocation
+            # costs seconds for a single-URL analysis
+            if os.path.exists(DEFAULT_MODEL_PATH):
+                print("📦 Loading pre-trained models...")
+                detector.load(DEFAULT_MODEL_PATH)
+            else:
+                print("📊 Training models with sample data...")
+                urls, labels = create_sample_dataset()
+                detector.train_neural_network(urls, labels, epochs=30)
+                detector.save(DEFAULT_MODEL_PATH)
+            # int8 linear layers for fast CPU inference
+            detector.quantize()
+
             result = detector.predict_url(args.url)
             
             status = "🚨 PHISHING" if result['final_prediction']['is_phishing'] else "✅ LEGITIMATE"
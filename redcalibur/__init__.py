@@ -4,90 +4,68 @@
 
 "Forged at the intersection of artificial intelligence and offensive cybersecurity."
 
-RedCalibur is a modular red teaming toolkit that leverages machine learning 
+RedCalibur is a modular red teaming toolkit that leverages machine learning
 and large language models (LLMs) to supercharge ethical hacking workflows.
 
 Author: Praneesh R V
 Purpose: AI and Neural Networks Major Project
 """
 
-"""
-RedCalibur - AI-Powered Red Teaming Toolkit
-
-A comprehensive toolkit for penetration testing and OSINT reconnaissance,
-enhanced with artificial intelligence capabilities.
-
-Author: PraneeshRV
-License: MIT
-Version: 1.0.0
-"""
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "PraneeshRV"
 __email__ = "praneeshrv404@gmail.com"
 __license__ = "MIT"
+__description__ = "AI-Powered Red Teaming Toolkit"
 
-# Core imports for easy access
+# Core imports for easy access (lightweight)
 from .config import Config, setup_logging
 
-# AI Core components
-from .ai_core import (
-    RedTeamNeuralNet,
-    EnsembleAISystem,
-    TransformerClassifier,
-    LLMIntegration,
-    AIModelConfig,
-    create_phishing_detector,
-    create_neural_classifier,
-    create_llm_integration
-)
-
-# Phishing Detection
-from .phishing_detection import AIPhishingDetector, create_sample_dataset
+# Heavy AI components (torch/transformers/genai) are resolved lazily via
+# PEP 562 so importing redcalibur stays fast and cheap for CLI/API startup.
+_LAZY = {
+    "BaseAIModel": "redcalibur.ai_core",
+    "TransformerClassifier": "redcalibur.ai_core",
+    "RedTeamNeuralNet": "redcalibur.ai_core",
+    "LLMIntegration": "redcalibur.ai_core",
+    "EnsembleAISystem": "redcalibur.ai_core",
+    "AIModelConfig": "redcalibur.ai_core",
+    "create_phishing_detector": "redcalibur.ai_core",
+    "create_neural_classifier": "redcalibur.ai_core",
+    "create_llm_integration": "redcalibur.ai_core",
+    "AIPhishingDetector": "redcalibur.phishing_detection",
+    "create_sample_dataset": "redcalibur.phishing_detection",
+}
 
-# Make commonly used functions available at package level
 __all__ = [
     "Config",
     "setup_logging",
-    "AIPhishingDetector",
-    "create_sample_dataset",
-    "NeuralNetwork",
-    "EnsembleModel",
-    "TransformerClassifier",
     "__version__",
-    "__author__"
+    "__author__",
+    *_LAZY,
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY:
+        mod = importlib.import_module(_LAZY[name])
+        obj = getattr(mod, name)
+        globals()[name] = obj  # cache for subsequent lookups
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 # Package metadata
 metadata = {
     "name": "RedCalibur",
     "version": __version__,
-    "description": "AI-Powered Red Teaming Toolkit",
+    "description": __description__,
     "author": __author__,
     "license": __license__,
     "url": "https://github.com/PraneeshRV/RedCalibur"
 }
-__email__ = "praneeshrv404@gmail.com"
-__description__ = "AI-Powered Red Teaming Toolkit"
-
-from .ai_core import (
-    BaseAIModel,
-    TransformerClassifier,
-    RedTeamNeuralNet,
-    LLMIntegration,
-    EnsembleAISystem,
-    create_phishing_detector,
-    create_neural_classifier,
-    create_llm_integration
-)
-
-__all__ = [
-    'BaseAIModel',
-    'TransformerClassifier', 
-    'RedTeamNeuralNet',
-    'LLMIntegration',
-    'EnsembleAISystem',
-    'create_phishing_detector',
-    'create_neural_classifier',
-    'create_llm_integration'
-]
@@ -9,281 +9,228 @@ Author: Praneesh
 Purpose: AI and Neural Networks Major Project
 """
 
+import asyncio
 import os
 import json
 import logging
-from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
 
-import torch
-import torch.nn as nn
 import numpy as np
-from transformers import (
-    AutoTokenizer,
-    AutoModelForCausalLM
-)
-from sklearn.base import BaseEstimator, ClassifierMixin
-import google.generativeai as genai
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The torch/transformers-backed models live in .models and are resolved on
+# first attribute access (PEP 562), so `import redcalibur.ai_core` stays
+# cheap for callers that only need the LLM integration or the ensemble.
+_LAZY_MODELS = (
+    "AIModelConfig",
+    "BaseAIModel",
+    "RedTeamNeuralNet",
+    "TransformerClassifier",
+    "convert_bn_to_ln",
+)
 
-@dataclass
-class AIModelConfig:
-    """Configuration for AI models."""
-    model_name: str
-    model_type: str  # 'transformer', 'neural_net', 'llm'
-    use_gpu: bool = True
-    max_length: int = 512
-    batch_size: int = 32
-    learning_rate: float = 1e-5
-
-
-class BaseAIModel(ABC):
-    """Abstract base class for all AI models in RedCalibur."""
-    
-    def __init__(self, config: AIModelConfig):
-        self.config = config
-        self.device = torch.device('cuda' if torch.cuda.is_available() and config.use_gpu else 'cpu')
-        self.model = None
-        self.tokenizer = None
-        
-    @abstractmethod
-    def load_model(self):
-        """Load the AI model."""
-        pass
-    
-    @abstractmethod
-    def predict(self, input_data: Union[str, List[str]]) -> Dict[str, Any]:
-        """Make predictions using the model."""
-        pass
-    
-    @abstractmethod
-    def train(self, train_data: Any, validation_data: Any = None):
-        """Train the model."""
-        pass
-
-
-class RedTeamNeuralNet(nn.Module):
-    """
-    Custom Neural Network for Red Team Operations
-    
-    This neural network is designed for cybersecurity classification tasks
-    such as phishing detection, malware classification, etc.
-    """
-    
-    def __init__(self, input_size: int, hidden_sizes: List[int], output_size: int, dropout_rate: float = 0.3):
-        super(RedTeamNeuralNet, self).__init__()
-        
-        layers = []
-        prev_size = input_size
-        
-        # Create hidden layers
-        for hidden_size in hidden_sizes:
-            layers.extend([
-                nn.Linear(prev_size, hidden_size),
-                nn.ReLU(),
-                nn.BatchNorm1d(hidden_size),
-                nn.Dropout(dropout_rate)
-            ])
-            prev_size = hidden_size
-        
-        # Output layer
-        layers.append(nn.Linear(prev_size, output_size))
-        
-        self.network = nn.Sequential(*layers)
-        
-    def forward(self, x):
-        return self.network(x)
-
-
-class TransformerClassifier(BaseAIModel):
-    """
-    Transformer-based classifier for text analysis in red teaming.
-    
-    Uses pre-trained transformers for tasks like:
-    - Phishing email detection
-    - Malicious URL classification
-    - Social engineering content analysis
-    """
-    
-    def __init__(self, config: AIModelConfig):
-        super().__init__(config)
-        self.load_model()
-    
-    def load_model(self):
-        """Load pre-trained transformer model."""
-        try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.config.model_name)
-            self.model = AutoModelForCausalLM.from_pretrained(self.config.model_name)
-            self.model.to(self.device)
-            logger.info(f"Loaded transformer model: {self.config.model_name}")
-        except Exception as e:
-            logger.error(f"Failed to load transformer model: {e}")
-            logger.info("Using fallback heuristic-based analysis instead")
-            self.model = None
-            self.tokenizer = None
-    
-    def predict(self, input_data: Union[str, List[str]]) -> Dict[str, Any]:
-        """Predict using the transformer model."""
-        if isinstance(input_data, str):
-            input_data = [input_data]
-        
-        if not self.model or not self.tokenizer:
-            # Use fallback heuristic analysis
-            return self._fallback_analysis(input_data[0])
-        
-        try:
-            # Tokenize input
-            encoded = self.tokenizer(
-                input_data,
-                padding=True,
-                truncation=True,
-                max_length=self.config.max_length,
-                return_tensors='pt'
-            )
-            
-            # Move to device
-            encoded = {k: v.to(self.device) for k, v in encoded.items()}
-            
-            # Predict
-            with torch.no_grad():
-                outputs = self.model(**encoded)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-            
-            return {
-                'predictions': predictions.cpu().numpy(),
-                'logits': outputs.logits.cpu().numpy(),
-                'confidence': torch.max(predictions, dim=-1)[0].cpu().numpy()
-            }
-        except Exception as e:
-            return self._fallback_analysis(input_data[0])
-    
-    def _fallback_analysis(self, text: str) -> Dict[str, Any]:
-        """Simple fallback analysis when transformer is not available."""
-        suspicious_keywords = [
-            'urgent', 'immediate', 'verify', 'suspend', 'click here',
-            'limited time', 'act now', 'confirm identity', 'update payment',
-            'secure', 'account', 'login', 'bank', 'paypal', 'amazon'
-        ]
-        
-        text_lower = text.lower()
-        suspicious_count = sum(1 for keyword in suspicious_keywords if keyword in text_lower)
-        
-        # Simple heuristic scoring
-        score = min(suspicious_count / len(suspicious_keywords), 1.0)
-        
-        return {
-            'predictions': [[1-score, score]],
-            'confidence': [max(score, 1-score)],
-            'method': 'heuristic_fallback',
-            'suspicious_keywords_found': suspicious_count
-        }
-    
-    def train(self, train_data: Any, validation_data: Any = None):
-        """Train the transformer model."""
-        # Implementation for fine-tuning transformers
-        # This would include training loop with proper optimization
-        pass
+# Analysis prompt templates, compiled once at import; only the selected
+# template is formatted per call (keys are interned as dict-literal constants).
+_PROMPTS = {
+    'phishing': "Analyze this content for phishing indicators: {content}",
+    'social_engineering': "Identify social engineering techniques in: {content}",
+    'vulnerability': "Assess potential security vulnerabilities in: {content}",
+    'general': "Perform a cybersecurity analysis of: {content}"
+}
 
 
 class LLMIntegration:
     """
     Large Language Model Integration for RedCalibur
-    
+
     Supports multiple LLM providers:
     - Gemini
     - Local models via transformers
     """
-    
+
     def __init__(self, provider: str = 'gemini', api_key: Optional[str] = None):
         self.provider = provider
         self.api_key = api_key or os.getenv(f'{provider.upper()}_API_KEY')
-        
+        # Identical prompts currently being generated share one provider call
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Provider-side caches of the shared prompt prefix per analysis type
+        self._prefix_cache: Dict[str, Any] = {}
+        self._genai = None
+
         if provider == 'gemini':
+            import google.generativeai as genai  # lazy: pulls in grpc
+            self._genai = genai
             genai.configure(api_key=self.api_key)
             self.client = genai.GenerativeModel('gemini-pro')
-        
+
         logger.info(f"Initialized LLM integration with provider: {provider}")
-    
+
     async def generate_response(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
-        """Generate response using LLM."""
+        """Generate response using LLM.
+
+        Concurrent calls with the same prompt and settings are coalesced
+        onto a single in-flight provider request.
+        """
+        key = f"{prompt}\x00{max_tokens}\x00{temperature}"
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await existing
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            if self.provider == 'gemini':
-                response = await self.client.generate_content_async(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=max_tokens,
-                        temperature=temperature
+            result = None
+            try:
+                if self.provider == 'gemini':
+                    response = await self.client.generate_content_async(
+                        prompt,
+                        generation_config=self._genai.types.GenerationConfig(
+                            max_output_tokens=max_tokens,
+                            temperature=temperature
+                        )
                     )
-                )
-                return response.text
-                
-        except Exception as e:
-            logger.error(f"LLM generation failed: {e}")
-            return f"Error: {e}"
-    
+                    result = response.text
+
+            except Exception as e:
+                logger.error(f"LLM generation failed: {e}")
+                result = f"Error: {e}"
+
+            future.set_result(result)
+            return result
+        finally:
+            # Runs even when the leader is cancelled (CancelledError is a
+            # BaseException): drop the entry and cancel the future so
+            # waiters don't hang on it forever
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.cancel()
+
+    async def generate_responses(self, prompts: List[str], max_tokens: int = 1000,
+                                 temperature: float = 0.7) -> List[str]:
+        """Generate responses for many prompts concurrently."""
+        return list(await asyncio.gather(
+            *[self.generate_response(p, max_tokens, temperature) for p in prompts]
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_prompt(analysis_type: str, content: str) -> str:
+        """Format (and memoize) the analysis prompt for repeat queries."""
+        return _PROMPTS.get(analysis_type, _PROMPTS['general']).format(content=content)
+
     def analyze_for_red_team(self, content: str, analysis_type: str = 'general') -> Dict[str, Any]:
         """Analyze content for red team operations."""
-        prompts = {
-            'phishing': f"Analyze this content for phishing indicators: {content}",
-            'social_engineering': f"Identify social engineering techniques in: {content}",
-            'vulnerability': f"Assess potential security vulnerabilities in: {content}",
-            'general': f"Perform a cybersecurity analysis of: {content}"
-        }
-        
-        prompt = prompts.get(analysis_type, prompts['general'])
-        # This would be implemented with async call in practice
+        prompt = self._format_prompt(analysis_type, content)
+        # Sync variant keeps the historical shape; use the async variant
+        # below to actually run the model.
         return {'analysis': prompt, 'type': analysis_type}
 
+    def _cached_prefix(self, analysis_type: str):
+        """Resolve a provider-side cache of the shared prompt prefix.
+
+        Every analyze call with the same type re-sends the same instruction
+        prefix; Gemini context caching keeps those prefill tokens server-side
+        so repeat calls only pay for the content. Best effort — if the
+        provider or model doesn't support caching this resolves to None
+        (memoized, so we don't retry on every call).
+        """
+        if analysis_type not in self._prefix_cache:
+            cached = None
+            if self.provider == 'gemini':
+                try:
+                    template = _PROMPTS.get(analysis_type, _PROMPTS['general'])
+                    prefix = template.format(content='').rstrip()
+                    cached = self._genai.caching.CachedContent.create(
+                        model='gemini-pro', contents=[prefix]
+                    )
+                except Exception as e:
+                    logger.debug(f"Prefix caching unavailable for {analysis_type}: {e}")
+            self._prefix_cache[analysis_type] = cached
+        return self._prefix_cache[analysis_type]
+
+    async def analyze_for_red_team_async(self, content: str, analysis_type: str = 'general') -> Dict[str, Any]:
+        """Analyze content for red team operations, awaiting the LLM."""
+        cached = self._cached_prefix(analysis_type)
+        if cached is not None:
+            try:
+                model = self._genai.GenerativeModel.from_cached_content(cached_content=cached)
+                response = await model.generate_content_async(content)
+                return {'analysis': response.text, 'type': analysis_type}
+            except Exception as e:
+                logger.error(f"Cached-prefix generation failed: {e}")
+
+        prompt = self._format_prompt(analysis_type, content)
+        return {'analysis': await self.generate_response(prompt), 'type': analysis_type}
+
 
 class EnsembleAISystem:
     """
     Ensemble AI System combining multiple models for robust red team analysis.
-    
+
     This system combines:
     - Neural networks for pattern recognition
     - Transformers for text analysis
     - LLMs for contextual understanding
     """
-    
+
     def __init__(self):
         self.models = {}
         self.llm = None
-        
-    def add_model(self, name: str, model: BaseAIModel):
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_size = 0
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """One worker per model, kept alive across calls."""
+        if self._pool is None or self._pool_size < len(self.models):
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool_size = max(1, len(self.models))
+            self._pool = ThreadPoolExecutor(max_workers=self._pool_size)
+        return self._pool
+
+    def add_model(self, name: str, model: "BaseAIModel"):
         """Add a model to the ensemble."""
         self.models[name] = model
         logger.info(f"Added model to ensemble: {name}")
-    
+
     def set_llm(self, llm: LLMIntegration):
         """Set the LLM for the ensemble."""
         self.llm = llm
-    
+
     def ensemble_predict(self, input_data: str, task_type: str = 'classification') -> Dict[str, Any]:
         """Make ensemble predictions combining all models."""
         results = {}
-        
-        # Get predictions from all models
-        for name, model in self.models.items():
-            try:
-                results[name] = model.predict(input_data)
-            except Exception as e:
-                logger.error(f"Model {name} prediction failed: {e}")
-                results[name] = {'error': str(e)}
-        
+
+        # Dispatch all models concurrently — each predict releases the GIL
+        # (CUDA kernels, network I/O), so latency is bounded by the slowest
+        # model instead of the sum.
+        if self.models:
+            pool = self._executor()
+            futures = {
+                name: pool.submit(model.predict, input_data)
+                for name, model in self.models.items()
+            }
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Model {name} prediction failed: {e}")
+                    results[name] = {'error': str(e)}
+
         # Combine results (simple voting for now)
         ensemble_result = self._combine_predictions(results)
-        
+
         # Add LLM analysis if available
         if self.llm:
             ensemble_result['llm_analysis'] = self.llm.analyze_for_red_team(input_data)
-        
+
         return ensemble_result
-    
+
     def _combine_predictions(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Combine predictions from multiple models."""
         # Simple ensemble - can be made more sophisticated
@@ -292,22 +239,30 @@ class EnsembleAISystem:
             'ensemble_confidence': 0.0,
             'ensemble_prediction': None
         }
-        
-        # Calculate ensemble metrics
-        confidences = []
+
+        # Calculate ensemble metrics in one concatenate + mean instead of
+        # extending a Python list element by element
+        arrays = []
         for result in results.values():
-            if 'confidence' in result and not isinstance(result.get('confidence'), str):
-                confidences.extend(result['confidence'])
-        
-        if confidences:
-            combined['ensemble_confidence'] = np.mean(confidences)
-        
+            conf = result.get('confidence')
+            if conf is None or isinstance(conf, str):
+                continue
+            if isinstance(conf, (list, tuple)):
+                # entries can be scalars or per-token arrays of varying length
+                arrays.extend(np.asarray(c, dtype=np.float64).ravel() for c in conf)
+            else:
+                arrays.append(np.asarray(conf, dtype=np.float64).ravel())
+        if arrays:
+            combined['ensemble_confidence'] = float(np.concatenate(arrays).mean())
+
         return combined
 
 
 # Factory functions for easy model creation
-def create_phishing_detector(model_name: str = "distilbert-base-uncased") -> TransformerClassifier:
+def create_phishing_detector(model_name: str = "distilbert-base-uncased") -> "TransformerClassifier":
     """Create a phishing detection model."""
+    from .models import AIModelConfig, TransformerClassifier
+
     config = AIModelConfig(
         model_name=model_name,
         model_type='transformer',
@@ -316,8 +271,10 @@ def create_phishing_detector(model_name: str = "distilbert-base-uncased") -> Tra
     return TransformerClassifier(config)
 
 
-def create_neural_classifier(input_size: int, num_classes: int) -> RedTeamNeuralNet:
+def create_neural_classifier(input_size: int, num_classes: int) -> "RedTeamNeuralNet":
     """Create a neural network classifier."""
+    from .models import RedTeamNeuralNet
+
     return RedTeamNeuralNet(
         input_size=input_size,
         hidden_sizes=[256, 128, 64],
@@ -328,3 +285,16 @@ def create_neural_classifier(input_size: int, num_classes: int) -> RedTeamNeural
 def create_llm_integration(provider: str = 'gemini') -> LLMIntegration:
     """Create LLM integration."""
     return LLMIntegration(provider=provider)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODELS:
+        from . import models
+        value = getattr(models, name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(list(globals()) + list(_LAZY_MODELS)))
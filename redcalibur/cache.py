@@ -0,0 +1,198 @@
+"""
+Response caching for RedCalibur
+===============================
+
+Small TTL cache used to avoid re-running expensive external lookups
+(WHOIS, DNS, Shodan, VirusTotal) for targets that were queried recently.
+
+By default entries live in-process in a plain dict. When the REDIS_URL
+environment variable is set and the ``redis`` package is installed, the
+cache transparently reads/writes through Redis so multiple workers can
+share results.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+# Sensible TTLs per data source (seconds)
+TTL_DNS = 5 * 60          # DNS records change often
+TTL_WHOIS = 24 * 60 * 60  # WHOIS data is near-static
+TTL_SCAN = 10 * 60        # port scans / Shodan
+TTL_URLSCAN = 60 * 60     # VirusTotal verdicts
+TTL_SUMMARY = 24 * 60 * 60  # LLM summaries, keyed on the exact input
+
+
+def make_cache_key(endpoint: str, **params) -> str:
+    """Build a stable hash key from an endpoint name and its parameters."""
+    payload = json.dumps({"endpoint": endpoint, **params}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def ttl_memoize(ttl: float, maxsize: int = 1024):
+    """
+    TTL memoization for blocking helpers (sync counterpart of TTLCache).
+
+    Repeat calls with the same arguments within ``ttl`` seconds return the
+    stored value instead of redoing the network round trip. Error payloads
+    (dicts containing "error", or None) are never stored, and callers can
+    force a refresh with ``cache=False``.
+    """
+    def decorator(fn):
+        store: dict = {}  # key -> (expires_at, value)
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, cache: bool = True, **kwargs):
+            key = make_cache_key(fn.__qualname__, args=list(args), kwargs=kwargs)
+            now = time.monotonic()
+            if cache:
+                with lock:
+                    entry = store.get(key)
+                    if entry and entry[0] > now:
+                        return entry[1]
+
+            value = fn(*args, **kwargs)
+            if value is not None and not (isinstance(value, dict) and "error" in value):
+                with lock:
+                    if len(store) >= maxsize:
+                        expired = [k for k, (exp, _) in store.items() if exp <= now]
+                        for k in expired:
+                            del store[k]
+                        while len(store) >= maxsize:
+                            store.pop(next(iter(store)))
+                    store[key] = (time.monotonic() + ttl, value)
+            return value
+
+        return wrapper
+    return decorator
+
+
+# On-disk cache location for results that should survive process restarts
+CACHE_DIR = os.path.expanduser(
+    os.getenv("REDCALIBUR_CACHE_DIR", "~/.redcalibur/cache")
+)
+
+
+def disk_memoize(ttl: float):
+    """
+    Persistent TTL memoization for slow-changing external lookups.
+
+    Results are stored as JSON files under ``CACHE_DIR`` keyed by the
+    hashed call signature, so repeat runs of the CLI reuse yesterday's
+    Shodan/ASN answers instead of re-hitting rate-limited APIs. Freshness
+    comes from the file's mtime; error payloads are never stored, and
+    ``cache=False`` forces a refresh. Filesystem problems silently fall
+    back to calling through.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, cache: bool = True, **kwargs):
+            key = make_cache_key(fn.__qualname__, args=list(args), kwargs=kwargs)
+            path = os.path.join(CACHE_DIR, f"{key}.json")
+            if cache:
+                try:
+                    if os.stat(path).st_mtime + ttl > time.time():
+                        with open(path) as f:
+                            return json.load(f)
+                except (OSError, ValueError):
+                    pass
+
+            value = fn(*args, **kwargs)
+            if not (isinstance(value, dict) and "error" in value):
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    tmp = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp, "w") as f:
+                        json.dump(value, f, default=str)
+                    os.replace(tmp, path)  # atomic: readers never see partials
+                except (OSError, TypeError):
+                    pass
+            return value
+
+        return wrapper
+    return decorator
+
+
+class TTLCache:
+    """
+    In-process TTL cache with an optional Redis read/write-through layer.
+
+    Values must be JSON-serializable when Redis is enabled; the in-process
+    store holds them as-is.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._store: dict = {}  # key -> (expires_at, value)
+        self._lock = asyncio.Lock()
+        self._redis = None
+        self.hits = 0
+        self.misses = 0
+
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis.asyncio as aioredis  # lazy/optional import
+                self._redis = aioredis.from_url(redis_url, decode_responses=True)
+            except Exception:
+                # Fall back silently to the in-process store
+                self._redis = None
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        expired = [k for k, (exp, _) in self._store.items() if exp <= now]
+        for k in expired:
+            del self._store[k]
+        # Bound memory: drop oldest entries if still over capacity
+        while len(self._store) > self.maxsize:
+            self._store.pop(next(iter(self._store)))
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            entry = self._store.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            if entry:
+                del self._store[key]
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+                if raw is not None:
+                    self.hits += 1
+                    return json.loads(raw)
+            except Exception:
+                pass
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        async with self._lock:
+            self._evict_expired()
+            self._store[key] = (time.monotonic() + ttl, value)
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, json.dumps(value, default=str), ex=int(ttl))
+            except Exception:
+                pass
+
+    async def get_or_compute(self, key: str, ttl: float, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key`` or compute, store, and return it."""
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+        value = await coro_factory()
+        # Don't poison the cache with error payloads
+        if not (isinstance(value, dict) and "error" in value):
+            await self.set(key, value, ttl)
+        return value
+
+
+# Shared cache instance for the API layer
+response_cache = TTLCache()
@@ -1,4 +1,6 @@
+import functools
 import logging
+import mmap
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -6,11 +8,25 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+
+@functools.lru_cache(maxsize=1)
+def _load_wordlist(path: str) -> tuple:
+    """Memory-map and parse a wordlist file once per process."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return tuple(
+            line.decode().strip() for line in iter(mm.readline, b"") if line.strip()
+        )
+
+@functools.lru_cache(maxsize=1)
 def setup_logging(log_level="INFO"):
     """
     Set up logging configuration for RedCalibur.
     Serverless-friendly version that only uses console logging.
-    
+
+    Memoized: repeat calls (every RedCaliburCLI construction) return the
+    existing logger instead of re-running basicConfig(force=True), which
+    would tear down and recreate the handlers each time.
+
     Args:
         log_level (str): The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
@@ -34,6 +50,9 @@ class Config:
     SHODAN_API_KEY = os.getenv("SHODAN_API_KEY")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     VIRUSTOTAL_API_KEY = os.getenv("VIRUSTOTAL_API_KEY")
+
+    # Optional Redis for caching remote-API responses across invocations
+    REDIS_URL = os.getenv("REDIS_URL")
     
     # Rate limiting
     REQUEST_DELAY = 1  # seconds between requests
@@ -44,34 +63,64 @@ class Config:
     REPORT_FORMAT = "both"  # pdf, json, or both
     
     # OSINT settings
-    DEFAULT_PORTS = [
-        20, 21, 22, 23, 25, 53, 67, 68, 69, 80, 110, 111, 123, 135, 137, 138, 139, 143, 161, 162, 
-        179, 389, 443, 445, 465, 514, 515, 587, 636, 993, 995, 1080, 1433, 1434, 1521, 1723, 
+    # Immutable and pre-sorted: shared across instances without copying,
+    # and scanners can rely on the ordering
+    DEFAULT_PORTS = tuple(sorted({
+        20, 21, 22, 23, 25, 53, 67, 68, 69, 80, 110, 111, 123, 135, 137, 138, 139, 143, 161, 162,
+        179, 389, 443, 445, 465, 514, 515, 587, 636, 993, 995, 1080, 1433, 1434, 1521, 1723,
         2049, 3306, 3389, 5432, 5900, 5901, 6379, 8000, 8080, 8443, 8888, 9090, 27017
-    ]
-    SUBDOMAIN_WORDLIST = ["www", "mail", "ftp", "admin", "test", "dev", "staging", "api"]
+    }))
+    DEFAULT_SUBDOMAIN_WORDLIST = ("www", "mail", "ftp", "admin", "test", "dev", "staging", "api")
+    # Subdomain brute-force tuning: in-flight DNS queries and the public
+    # resolvers the async resolver rotates through
+    DNS_CONCURRENCY = int(os.getenv("DNS_CONCURRENCY", "200"))
+    DNS_RESOLVERS = ("1.1.1.1", "8.8.8.8")
+    # Concurrent TCP connect probes during a port scan
+    PORT_SCAN_WORKERS = int(os.getenv("PORT_SCAN_WORKERS", "50"))
+    # Concurrent Google-dork queries; kept low to stay under search-engine
+    # rate limits
+    DORK_CONCURRENCY = int(os.getenv("DORK_CONCURRENCY", "3"))
+    # Optional path to a larger wordlist; loaded once and cached (see below)
+    SUBDOMAIN_WORDLIST_FILE = os.getenv("SUBDOMAIN_WORDLIST_FILE")
+
+    # Set once the output directory has been created (or creation failed and
+    # was deliberately ignored) so validate_config skips the filesystem check
+    # on every subsequent call
+    _dirs_ready = False
+
+    @property
+    def SUBDOMAIN_WORDLIST(self):
+        """Subdomain candidates: the configured file if set, else the defaults."""
+        if self.SUBDOMAIN_WORDLIST_FILE:
+            try:
+                return _load_wordlist(self.SUBDOMAIN_WORDLIST_FILE)
+            except (OSError, ValueError):
+                # unreadable file, or empty (mmap refuses zero-byte files);
+                # fall back to the built-in list
+                pass
+        return self.DEFAULT_SUBDOMAIN_WORDLIST
     
     @classmethod
     def validate_config(cls):
         """Validate configuration settings"""
-        issues = []
-        
-        if not cls.SHODAN_API_KEY:
-            issues.append("SHODAN_API_KEY not set")
-        
-        if not cls.GEMINI_API_KEY:
-            issues.append("GEMINI_API_KEY not set")
-        
-        if not cls.VIRUSTOTAL_API_KEY:
-            issues.append("VIRUSTOTAL_API_KEY not set")
+        # API keys are read from the environment once at class-body time, so
+        # the missing-key list is stable for the life of the process and only
+        # needs to be computed on the first call
+        if not hasattr(cls, "_missing_keys"):
+            cls._missing_keys = [
+                f"{name} not set"
+                for name in ("SHODAN_API_KEY", "GEMINI_API_KEY", "VIRUSTOTAL_API_KEY")
+                if not getattr(cls, name)
+            ]
 
         # Skip directory creation in serverless environments
         # as we don't have write access to the filesystem
-        try:
-            if not os.path.exists(cls.OUTPUT_DIR):
-                os.makedirs(cls.OUTPUT_DIR)
-        except (OSError, PermissionError):
-            # Ignore filesystem errors in serverless environments
-            pass
-            
-        return issues
+        if not cls._dirs_ready:
+            try:
+                os.makedirs(cls.OUTPUT_DIR, exist_ok=True)
+                cls._dirs_ready = True
+            except (OSError, PermissionError):
+                # Ignore filesystem errors in serverless environments
+                cls._dirs_ready = True
+
+        return list(cls._missing_keys)
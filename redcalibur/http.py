@@ -0,0 +1,37 @@
+"""
+Shared HTTP client state for RedCalibur
+=======================================
+
+External API integrations (VirusTotal, Shodan, RDAP, ...) each used to
+open a fresh HTTPS connection per call, paying the TCP + TLS handshake
+every time. This module owns one process-wide httpx.AsyncClient with
+HTTP/2 and keep-alive pooling so sequential lookups reuse connections.
+"""
+
+from typing import Optional
+
+DEFAULT_TIMEOUT = 10.0
+
+_client = None
+
+
+def get_async_client():
+    """Return the shared httpx.AsyncClient, creating it on first use."""
+    global _client
+    if _client is None:
+        import httpx  # lazy import
+
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def aclose_client():
+    """Close the shared client (call from app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
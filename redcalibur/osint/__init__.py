@@ -1,3 +1,61 @@
 # This package contains modules for performing OSINT (Open Source Intelligence) tasks.
 
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
 __all__ = ["whois_lookup"]
+
+# In-process getaddrinfo cache. Repeated probes against the same hosts
+# (platform checks, retries, redirect chains) each pay a resolver round
+# trip otherwise; entries expire after _DNS_TTL so stale answers can't
+# outlive a normal DNS TTL. Failures are never cached. Installed once at
+# package import.
+_DNS_TTL = 300.0
+_DNS_CACHE_MAX = 512
+_dns_cache = {}
+_dns_lock = threading.Lock()
+_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_lock:
+        hit = _dns_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+    value = _getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_lock:
+        if len(_dns_cache) >= _DNS_CACHE_MAX:
+            for k in [k for k, (exp, _) in _dns_cache.items() if exp <= now]:
+                del _dns_cache[k]
+        if len(_dns_cache) >= _DNS_CACHE_MAX:
+            _dns_cache.pop(next(iter(_dns_cache)))
+        _dns_cache[key] = (now + _DNS_TTL, value)
+    return value
+
+
+if socket.getaddrinfo is not _cached_getaddrinfo:
+    socket.getaddrinfo = _cached_getaddrinfo
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+)
+
+# One pooled session shared by the HTTP helpers in this package, so probes
+# against the same origin reuse sockets instead of paying a fresh TCP+TLS
+# handshake per call (mirrors domain_infrastructure.SESSION).
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
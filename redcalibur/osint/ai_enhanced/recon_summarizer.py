@@ -1,4 +1,67 @@
+import asyncio
+import json
 import os
+import random
+import time
+
+# Items per Gemini request when batching; keeps prompts within sane size
+BATCH_SIZE = 10
+# Concurrent in-flight Gemini requests for summarize_many; keep under the
+# account's QPM limit
+CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+# Attempts per request with exponential backoff (429s, transient network)
+_RETRIES = 3
+
+
+def _build_prompt(raw_data: str) -> str:
+    return f"""
+        You are an expert cybersecurity analyst tasked with explaining technical findings to a non-technical audience.
+        Based on the following OSINT data, create a clear, concise, and easy-to-understand summary.
+        Focus on the key risks and actionable recommendations. Avoid jargon.
+
+        **Raw Data:**
+        {raw_data}
+
+        **Summary for a Non-Technical Audience:**
+        """
+
+# Every error return in this module starts with one of these prefixes;
+# is_error_summary keeps callers (and their caches) in sync with them
+_ERROR_PREFIXES = ("Error:", "An error occurred", "Gemini client not available")
+
+
+def is_error_summary(text) -> bool:
+    """True if ``text`` is one of this module's error strings, not a summary."""
+    return isinstance(text, str) and text.startswith(_ERROR_PREFIXES)
+
+
+_MODEL = None
+
+
+def _gemini_model():
+    """Return a configured Gemini model, or an error string if unavailable.
+
+    The model handle is built once per process: configure() plus
+    GenerativeModel construction were previously repeated on every summary.
+    Failures are not cached, so a later call can succeed once the
+    environment is fixed.
+    """
+    global _MODEL
+    if _MODEL is not None:
+        return _MODEL, None
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return None, "Error: GEMINI_API_KEY not found. Please set it in your environment."
+
+    try:
+        import google.generativeai as genai  # lazy import
+    except Exception as imp_err:
+        return None, f"Gemini client not available: {imp_err}"
+
+    genai.configure(api_key=api_key)
+    _MODEL = genai.GenerativeModel('gemini-2.5-flash')
+    return _MODEL, None
 
 def summarize_recon_data(raw_data: str) -> str:
     """
@@ -10,32 +73,161 @@ def summarize_recon_data(raw_data: str) -> str:
     Returns:
         str: A summarized, easy-to-understand report.
     """
-    try:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            return "Error: GEMINI_API_KEY not found. Please set it in your environment."
+    model, err = _gemini_model()
+    if err:
+        return err
+
+    delay = 1.0
+    last_error = None
+    for attempt in range(_RETRIES):
+        try:
+            response = model.generate_content(_build_prompt(raw_data))
+            return response.text
+        except Exception as e:
+            last_error = e
+            if attempt + 1 < _RETRIES:
+                time.sleep(delay + random.random() * delay)
+                delay *= 2
+
+    return f"An error occurred during summarization with Gemini API: {last_error}"
+
+async def summarize_recon_data_async(raw_data: str, timeout: float = 30.0) -> str:
+    """
+    Async variant of summarize_recon_data, awaiting the Gemini SDK directly.
+
+    Retries up to three times with jittered exponential backoff, so
+    transient failures and rate-limit responses don't surface immediately.
+
+    Args:
+        raw_data (str): The raw reconnaissance data in JSON format.
+        timeout (float): Per-attempt timeout in seconds.
+
+    Returns:
+        str: A summarized, easy-to-understand report.
+    """
+    model, err = _gemini_model()
+    if err:
+        return err
 
+    delay = 1.0
+    last_error = None
+    for attempt in range(_RETRIES):
         try:
-            import google.generativeai as genai  # lazy import
-        except Exception as imp_err:
-            return f"Gemini client not available: {imp_err}"
+            response = await asyncio.wait_for(
+                model.generate_content_async(_build_prompt(raw_data)), timeout
+            )
+            return response.text
+        except Exception as e:
+            last_error = e
+            if attempt + 1 < _RETRIES:
+                await asyncio.sleep(delay + random.random() * delay)
+                delay *= 2
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+    return f"An error occurred during summarization with Gemini API: {last_error}"
 
-        prompt = f"""
+
+async def summarize_many(raw_items, concurrency: int = CONCURRENCY,
+                         timeout: float = 30.0) -> list:
+    """
+    Summarize many records concurrently, bounded by a semaphore.
+
+    The work is network-RTT-bound, so overlapping requests multiplies
+    throughput linearly up to the provider's rate limit.
+
+    Args:
+        raw_items (list[str]): Raw reconnaissance data records, JSON format.
+        concurrency (int): Maximum in-flight Gemini requests.
+        timeout (float): Per-attempt timeout in seconds.
+
+    Returns:
+        list[str]: One summary (or error string) per input record.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(raw):
+        async with sem:
+            return await summarize_recon_data_async(raw, timeout)
+
+    return list(await asyncio.gather(*(_one(raw) for raw in raw_items)))
+
+
+def _build_batch_prompt(raw_items) -> str:
+    blocks = "\n".join(
+        f"--- ITEM {i} ---\n{raw}" for i, raw in enumerate(raw_items)
+    )
+    return f"""
         You are an expert cybersecurity analyst tasked with explaining technical findings to a non-technical audience.
-        Based on the following OSINT data, create a clear, concise, and easy-to-understand summary.
+        Below are {len(raw_items)} independent OSINT data records, delimited by "--- ITEM n ---" markers.
+        For each record, create a clear, concise, and easy-to-understand summary.
         Focus on the key risks and actionable recommendations. Avoid jargon.
+        Respond with a JSON array of {len(raw_items)} strings, where element n is the summary of ITEM n.
 
-        **Raw Data:**
-        {raw_data}
-
-        **Summary for a Non-Technical Audience:**
+        {blocks}
         """
 
-        response = model.generate_content(prompt)
-        return response.text
+
+def summarize_recon_data_batch(raw_items) -> list:
+    """
+    Summarize several independent recon records in one Gemini request.
+
+    Per-item calls pay a network round trip and a rate-limit slot each;
+    packing up to BATCH_SIZE records into a single prompt with a JSON-array
+    response amortizes both, and the shared instruction preamble is sent
+    once instead of per item.
+
+    Args:
+        raw_items (list[str]): Raw reconnaissance data records, JSON format.
+
+    Returns:
+        list[str]: One summary (or error string) per input record.
+    """
+    raw_items = list(raw_items)
+    if not raw_items:
+        return []
+
+    model, err = _gemini_model()
+    if err:
+        return [err] * len(raw_items)
+
+    summaries = []
+    for start in range(0, len(raw_items), BATCH_SIZE):
+        batch = raw_items[start:start + BATCH_SIZE]
+        try:
+            response = model.generate_content(
+                _build_batch_prompt(batch),
+                generation_config={"response_mime_type": "application/json"},
+            )
+            parsed = json.loads(response.text)
+            if not isinstance(parsed, list) or len(parsed) != len(batch):
+                raise ValueError(f"expected {len(batch)} summaries, got {parsed!r:.80}")
+            summaries.extend(str(s) for s in parsed)
+        except Exception:
+            # Misaligned or failed batch: fall back to per-item calls so one
+            # bad response can't corrupt the item/summary pairing
+            summaries.extend(summarize_recon_data(raw) for raw in batch)
+
+    return summaries
+
+
+def summarize_recon_data_stream(raw_data: str):
+    """
+    Stream the summary as it is generated, chunk by chunk.
+
+    Yields text fragments so callers (e.g. a StreamingResponse) can show
+    output at time-to-first-token instead of waiting for the full report.
+
+    Args:
+        raw_data (str): The raw reconnaissance data in JSON format.
+    """
+    try:
+        model, err = _gemini_model()
+        if err:
+            yield err
+            return
+
+        for chunk in model.generate_content(_build_prompt(raw_data), stream=True):
+            if chunk.text:
+                yield chunk.text
 
     except Exception as e:
-        return f"An error occurred during summarization with Gemini API: {str(e)}"
+        yield f"An error occurred during summarization with Gemini API: {str(e)}"
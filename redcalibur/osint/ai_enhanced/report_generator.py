@@ -16,14 +16,20 @@ def generate_pdf_report(data, output_path):
         pdf = FPDF()
         pdf.set_auto_page_break(auto=True, margin=15)
         pdf.add_page()
-        pdf.set_font("Arial", size=12)
+        # Helvetica is a built-in Type1 core font: no metric-file parsing,
+        # unlike the Arial alias path
+        pdf.set_font("Helvetica", size=12)
 
         pdf.cell(200, 10, txt="Reconnaissance Report", ln=True, align='C')
         pdf.ln(10)
 
         for key, value in data.items():
-            pdf.cell(200, 10, txt=f"{key}: {value}", ln=True)
+            # multi_cell wraps long values across lines instead of clipping
+            # them at a fixed 200mm cell
+            pdf.multi_cell(0, 10, f"{key}: {value}")
 
+        # fpdf2 streams page bodies straight to the file here, so memory
+        # stays bounded however many rows the report has
         pdf.output(output_path)
         return output_path
     except Exception as e:
@@ -41,33 +47,37 @@ def generate_markdown_report(data: dict, output_path: str) -> str:
         str: The path to the generated Markdown report.
     """
     try:
-        with open(output_path, 'w') as f:
-            f.write("# RedCalibur Reconnaissance Report\n\n")
-            
-            if "gemini_summary" in data:
-                f.write("## AI-Powered Summary\n\n")
-                f.write(data["gemini_summary"])
-                f.write("\n\n")
+        # Accumulate the whole report in memory and write once: the old
+        # per-field f.write calls meant O(sections * fields) tiny writes
+        parts = ["# RedCalibur Reconnaissance Report\n\n"]
+        append = parts.append
 
-            for section, content in data.items():
-                if section == "gemini_summary":
-                    continue
-                f.write(f"## {section.replace('_', ' ').title()}\n\n")
-                if isinstance(content, dict):
-                    for key, value in content.items():
-                        f.write(f"**{key.replace('_', ' ').title()}:**\n")
-                        if isinstance(value, dict):
-                            f.write("```json\n")
-                            f.write(json.dumps(value, indent=2, default=str))
-                            f.write("\n```\n\n")
-                        elif isinstance(value, list):
-                            for item in value:
-                                f.write(f"- {item}\n")
-                            f.write("\n")
-                        else:
-                            f.write(f"{value}\n\n")
-                else:
-                    f.write(f"{content}\n\n")
+        if "gemini_summary" in data:
+            append("## AI-Powered Summary\n\n")
+            append(data["gemini_summary"])
+            append("\n\n")
+
+        for section, content in data.items():
+            if section == "gemini_summary":
+                continue
+            append(f"## {section.replace('_', ' ').title()}\n\n")
+            if isinstance(content, dict):
+                for key, value in content.items():
+                    append(f"**{key.replace('_', ' ').title()}:**\n")
+                    if isinstance(value, dict):
+                        append("```json\n")
+                        append(json.dumps(value, indent=2, default=str))
+                        append("\n```\n\n")
+                    elif isinstance(value, list):
+                        append("".join(f"- {item}\n" for item in value))
+                        append("\n")
+                    else:
+                        append(f"{value}\n\n")
+            else:
+                append(f"{content}\n\n")
+
+        with open(output_path, 'w', buffering=65536) as f:
+            f.write("".join(parts))
         return output_path
     except Exception as e:
         return f"Error in generating Markdown report: {str(e)}"
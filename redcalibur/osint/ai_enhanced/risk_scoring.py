@@ -1,3 +1,24 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the scalar math runs fine without it
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def _score(subdomains: float, ssl_ok: float, a_count: float) -> float:
+    # weights tuned for simple prioritization
+    return (
+        min(subdomains / 50.0, 1.0) * 0.4 +  # many subdomains → larger surface
+        (1.0 - ssl_ok) * 0.4 +               # missing/invalid SSL increases risk
+        min(a_count / 10.0, 1.0) * 0.2       # multiple A records implies complexity
+    )
+
+
 def calculate_risk_score(features):
     """
     Calculate a basic risk score based on input features.
@@ -15,12 +36,33 @@ def calculate_risk_score(features):
         ssl_ok = float(features[1]) if len(features) > 1 else 0.0
         a_count = float(features[2]) if len(features) > 2 else 0.0
 
-        # weights tuned for simple prioritization
-        score = (
-            min(subdomains / 50.0, 1.0) * 0.4 +  # many subdomains → larger surface
-            (1.0 - ssl_ok) * 0.4 +               # missing/invalid SSL increases risk
-            min(a_count / 10.0, 1.0) * 0.2       # multiple A records implies complexity
-        )
-        return round(score, 3)
+        return round(float(_score(subdomains, ssl_ok, a_count)), 3)
     except Exception as e:
         return f"Error in risk scoring: {str(e)}"
+
+
+def calculate_risk_scores(features):
+    """
+    Score a whole batch of targets in one vectorized pass.
+
+    Same weights as calculate_risk_score, expressed over an (N, 3) array —
+    a handful of flops per row instead of a Python call each.
+
+    Args:
+        features: Array-like of shape (N, 3) with rows of
+            [subdomain_count, has_valid_ssl (0/1), a_records_count].
+            Missing trailing columns are treated as zero.
+
+    Returns:
+        np.ndarray: Risk scores between 0 and 1, one per row.
+    """
+    arr = np.atleast_2d(np.asarray(features, dtype=np.float64))
+    if arr.shape[1] < 3:
+        arr = np.pad(arr, ((0, 0), (0, 3 - arr.shape[1])))
+
+    scores = (
+        np.minimum(arr[:, 0] / 50.0, 1.0) * 0.4 +
+        (1.0 - arr[:, 1]) * 0.4 +
+        np.minimum(arr[:, 2] / 10.0, 1.0) * 0.2
+    )
+    return np.round(scores, 3)
@@ -0,0 +1,43 @@
+"""
+Shared DNS resolver and HTTP session state for the domain_infrastructure
+helpers.
+
+Every helper in this package that resolves names goes through one cached
+resolver so repeat lookups of the same name skip the network entirely, and
+every HTTP probe goes through one keep-alive session so same-origin
+requests reuse sockets instead of paying a fresh TCP+TLS handshake each.
+"""
+
+import dns.resolver
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# One answer cache shared by every resolver this package constructs.
+DNS_CACHE = dns.resolver.LRUCache(max_size=10000)
+
+_RESOLVER = dns.resolver.Resolver(configure=True)
+_RESOLVER.cache = DNS_CACHE
+_RESOLVER.timeout = 1.5
+_RESOLVER.lifetime = 3.0
+
+
+def get_resolver():
+    """Return the shared caching resolver."""
+    return _RESOLVER
+
+
+# One pooled session shared by every HTTP helper in this package.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=100,
+    pool_maxsize=100,
+    # Also retry rate-limit and transient server statuses, honoring any
+    # Retry-After header, not just connection-level failures
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+    ),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
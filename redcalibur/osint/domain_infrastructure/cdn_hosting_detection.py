@@ -1,9 +1,15 @@
-import requests
+from . import SESSION
+from ...cache import ttl_memoize
 
+
+@ttl_memoize(ttl=900)
 def detect_cdn_and_hosting(url):
     """
     Detect the CDN and hosting provider for the given URL.
 
+    Results are memoized for 15 minutes per URL (pass ``cache=False`` to
+    force a refetch) since CDN/hosting assignments rarely change mid-run.
+
     Args:
         url (str): The URL to analyze.
 
@@ -11,7 +17,7 @@ def detect_cdn_and_hosting(url):
         dict: A dictionary containing CDN and hosting provider information.
     """
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=6)
         headers = response.headers
 
         cdn_hosting_info = {
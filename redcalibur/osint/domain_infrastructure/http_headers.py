@@ -1,9 +1,16 @@
-import requests
+from . import SESSION
+from ...cache import ttl_memoize
 
+
+@ttl_memoize(ttl=900)
 def get_http_headers(url):
     """
     Retrieve HTTP headers for the given URL.
 
+    Responses are memoized for 15 minutes, so iterative pipeline runs
+    against the same URL cost a dict lookup instead of a round trip;
+    pass ``cache=False`` to force a refetch.
+
     Args:
         url (str): The URL to analyze.
 
@@ -11,7 +18,7 @@ def get_http_headers(url):
         dict: A dictionary containing HTTP headers.
     """
     try:
-        response = requests.head(url)
+        response = SESSION.head(url, timeout=6)
         return response.headers
     except Exception as e:
         return {"error": str(e)}
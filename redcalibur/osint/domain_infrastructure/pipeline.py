@@ -0,0 +1,59 @@
+"""
+Composed domain scan over the async helpers in this package.
+
+The individual lookups touch different subsystems (DNS, WHOIS/RDAP, TLS,
+HTTP) and share no state, so running them together collapses wall time to
+the slowest single lookup instead of the sum of five.
+"""
+
+import asyncio
+
+from .dns_enumeration import enumerate_dns_records_async
+from .http_headers import get_http_headers
+from .ssl_tls_details import get_ssl_details_async
+from .tech_stack_identification import identify_tech_stack
+from .whois_lookup import perform_whois_lookup_async
+
+
+async def scan_domain(domain):
+    """
+    Run the full domain_infrastructure fan-out for one domain concurrently.
+
+    Args:
+        domain (str): The domain to scan.
+
+    Returns:
+        dict: Keys dns, whois, ssl, headers, tech; a failed lookup maps to
+        an {"error": ...} dict rather than failing the scan.
+    """
+    url = f"https://{domain}"
+    results = await asyncio.gather(
+        enumerate_dns_records_async(domain),
+        perform_whois_lookup_async(domain),
+        get_ssl_details_async(domain),
+        # Sync requests-based helpers run on threads alongside the natives
+        asyncio.to_thread(get_http_headers, url),
+        asyncio.to_thread(identify_tech_stack, url),
+        return_exceptions=True,
+    )
+    return {
+        name: res if not isinstance(res, Exception) else {"error": str(res)}
+        for name, res in zip(("dns", "whois", "ssl", "headers", "tech"), results)
+    }
+
+
+def scan_domains(domains):
+    """
+    Scan several domains, each with its own concurrent fan-out.
+
+    Args:
+        domains (list): Domains to scan.
+
+    Returns:
+        dict: Mapping of domain to its scan_domain result.
+    """
+    async def _all():
+        return await asyncio.gather(*(scan_domain(d) for d in domains))
+
+    domains = list(domains)
+    return dict(zip(domains, asyncio.run(_all())))
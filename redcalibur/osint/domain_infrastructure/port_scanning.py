@@ -1,25 +1,26 @@
-import socket
+import asyncio
 
-def perform_port_scan(target, ports):
+from .port_scanning_async import perform_port_scan_async
+
+
+def perform_port_scan(target, ports, concurrency=500, timeout=0.6):
     """
     Perform a port scan on the target.
 
+    Sync wrapper around the asyncio scanner: instead of one blocking
+    connect_ex per port (up to N * timeout seconds), hundreds of connects
+    are in flight at once, so wall time is roughly one timeout for any
+    port list narrower than the semaphore.
+
     Args:
         target (str): The target IP or domain.
         ports (list): A list of ports to scan.
+        concurrency (int): Maximum simultaneous connection attempts.
+        timeout (float): Per-port connect timeout in seconds.
 
     Returns:
         dict: A dictionary with port statuses.
     """
-    port_status = {}
-
-    for port in ports:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(0.6)
-            try:
-                result = s.connect_ex((target, port))
-                port_status[port] = "Open" if result == 0 else "Closed"
-            except Exception as e:
-                port_status[port] = f"Error: {e}"
-
-    return port_status
+    return asyncio.run(
+        perform_port_scan_async(target, ports, concurrency=concurrency, timeout=timeout)
+    )
@@ -0,0 +1,41 @@
+import asyncio
+
+
+async def scan_port(host, port, sem, timeout: float = 1.0):
+    """
+    Probe a single TCP port, bounded by the shared semaphore.
+
+    Returns:
+        tuple: (port, status string) matching perform_port_scan's values.
+    """
+    async with sem:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            # The handshake completing is the whole answer — abort() tears
+            # the connection down immediately (RST, no FIN exchange) so the
+            # semaphore slot is freed without waiting out a graceful close.
+            # asyncio already sets TCP_NODELAY on TCP transports.
+            writer.transport.abort()
+            return port, "Open"
+        except (asyncio.TimeoutError, ConnectionRefusedError, OSError):
+            return port, "Closed"
+        except Exception as e:
+            return port, f"Error: {e}"
+
+
+async def perform_port_scan_async(target, ports, concurrency: int = 256, timeout: float = 1.0):
+    """
+    Perform a port scan on the target with overlapped async connects.
+
+    Args:
+        target (str): The target IP or domain.
+        ports (list): A list of ports to scan.
+        concurrency (int): Maximum simultaneous connection attempts.
+        timeout (float): Per-port connect timeout in seconds.
+
+    Returns:
+        dict: A dictionary with port statuses, same shape as perform_port_scan.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(*[scan_port(target, p, sem, timeout) for p in ports])
+    return dict(results)
@@ -1,8 +1,68 @@
+import asyncio
 import ssl
 import socket
-from datetime import datetime
+from datetime import datetime, timezone
 import errno
 
+# Built once: creating a default context parses the whole system CA bundle
+# (hundreds of PEM certs). Contexts are safe to share across handshakes.
+_CTX = ssl.create_default_context()
+_CTX.load_default_certs()
+
+
+def _parse_cert(cert):
+    return {
+        "issuer": dict(x[0] for x in cert["issuer"]),
+        "subject": dict(x[0] for x in cert["subject"]),
+        "version": cert.get("version"),
+        "serialNumber": cert.get("serialNumber"),
+        # cert_time_to_seconds parses this exact format in C, without
+        # strptime re-tokenizing the format string on every call
+        "notBefore": datetime.fromtimestamp(
+            ssl.cert_time_to_seconds(cert["notBefore"]), tz=timezone.utc
+        ),
+        "notAfter": datetime.fromtimestamp(
+            ssl.cert_time_to_seconds(cert["notAfter"]), tz=timezone.utc
+        ),
+        "subjectAltName": cert.get("subjectAltName", [])
+    }
+
+
+async def get_ssl_details_async(hostname, port: int = 443, timeout: float = 6.0):
+    """
+    Retrieve SSL/TLS certificate details without blocking the event loop.
+
+    Handshakes against many hosts can run concurrently on one loop, so a
+    batch costs one handshake RTT instead of one per host.
+
+    Args:
+        hostname (str): The hostname to analyze.
+        port (int): TLS port to connect to.
+        timeout (float): Connect + handshake timeout in seconds.
+
+    Returns:
+        dict: A dictionary containing SSL/TLS certificate details.
+    """
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(hostname, port, ssl=_CTX, server_hostname=hostname),
+            timeout,
+        )
+        try:
+            cert = writer.get_extra_info("peercert")
+            return _parse_cert(cert)
+        finally:
+            writer.transport.abort()
+    except socket.gaierror as e:
+        return {"error": f"DNS resolution failed: {e}"}
+    except OSError as e:
+        if e.errno == errno.EAI_AGAIN:
+            return {"error": "Temporary failure in name resolution"}
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": str(e)}
+
+
 def get_ssl_details(hostname, port: int = 443):
     """
     Retrieve SSL/TLS certificate details for the given hostname.
@@ -14,19 +74,9 @@ def get_ssl_details(hostname, port: int = 443):
         dict: A dictionary containing SSL/TLS certificate details.
     """
     try:
-        context = ssl.create_default_context()
         with socket.create_connection((hostname, port), timeout=6) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                cert = ssock.getpeercert()
-                return {
-                    "issuer": dict(x[0] for x in cert["issuer"]),
-                    "subject": dict(x[0] for x in cert["subject"]),
-                    "version": cert.get("version"),
-                    "serialNumber": cert.get("serialNumber"),
-                    "notBefore": datetime.strptime(cert["notBefore"], "%b %d %H:%M:%S %Y %Z"),
-                    "notAfter": datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z"),
-                    "subjectAltName": cert.get("subjectAltName", [])
-                }
+            with _CTX.wrap_socket(sock, server_hostname=hostname) as ssock:
+                return _parse_cert(ssock.getpeercert())
     except socket.gaierror as e:
         return {"error": f"DNS resolution failed: {e}"}
     except OSError as e:
@@ -1,45 +1,67 @@
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 
-def discover_subdomains(domain, subdomain_list, timeout: float = 2.0, workers: int = 8):
+import dns.asyncresolver
+
+from . import DNS_CACHE
+
+# Public resolvers used for bulk discovery; rotating across several spreads load.
+DEFAULT_RESOLVERS = ("1.1.1.1", "8.8.8.8", "9.9.9.9")
+
+
+async def discover_subdomains_async(domain, subdomain_list, resolvers=DEFAULT_RESOLVERS,
+                                    concurrency: int = 1000, timeout: float = 2.0):
     """
-    Discover subdomains for the given domain using a wordlist.
+    Discover subdomains by resolving candidate names in bulk.
+
+    Queries are issued as non-blocking DNS lookups bounded by a semaphore,
+    so wall time is governed by the slowest unique resolution instead of
+    the wordlist length.
 
     Args:
         domain (str): The domain name to search.
         subdomain_list (list): A list of potential subdomains.
-        timeout (float): Per-request timeout seconds.
-        workers (int): Number of parallel workers.
+        resolvers (tuple): Nameserver IPs to query.
+        concurrency (int): Maximum in-flight queries.
+        timeout (float): Per-query timeout seconds.
 
     Returns:
-        list: A list of discovered subdomains (URLs).
+        list: A list of discovered subdomain hostnames.
     """
-    discovered_subdomains = []
-
-    def probe(sub: str):
-        url = f"http://{sub}.{domain}"
-        try:
-            # HEAD is lighter; some hosts may not support it, so fallback to GET
-            resp = requests.head(url, timeout=timeout, allow_redirects=True)
-            if resp.status_code < 400:
-                return url
-            # Fallback to GET if HEAD inconclusive
-            resp = requests.get(url, timeout=timeout, allow_redirects=True)
-            if resp.status_code < 400:
-                return url
-        except requests.RequestException:
-            return None
-        return None
-
-    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
-        futures = {ex.submit(probe, sub): sub for sub in subdomain_list}
-        for fut in as_completed(futures):
+    resolver = dns.asyncresolver.Resolver(configure=False)
+    resolver.nameservers = list(resolvers)
+    resolver.cache = DNS_CACHE
+    resolver.timeout = float(timeout)
+    resolver.lifetime = float(timeout)
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def query(sub: str):
+        name = f"{sub}.{domain}"
+        async with sem:
             try:
-                res = fut.result()
-                if res:
-                    discovered_subdomains.append(res)
+                await resolver.resolve(name, "A")
+                return name
             except Exception:
-                # ignore individual probe failures
-                pass
+                # NXDOMAIN, timeout, etc. — candidate doesn't exist
+                return None
+
+    answers = await asyncio.gather(*(query(sub) for sub in subdomain_list))
+    return [name for name in answers if name]
 
-    return discovered_subdomains
+
+def discover_subdomains(domain, subdomain_list, timeout: float = 2.0, workers: int = 8):
+    """
+    Discover subdomains for the given domain using a wordlist.
+
+    Synchronous wrapper around discover_subdomains_async for callers that
+    are not running an event loop. The ``workers`` argument is kept for
+    backward compatibility and ignored.
+
+    Args:
+        domain (str): The domain name to search.
+        subdomain_list (list): A list of potential subdomains.
+        timeout (float): Per-query timeout seconds.
+
+    Returns:
+        list: A list of discovered subdomain hostnames.
+    """
+    return asyncio.run(discover_subdomains_async(domain, subdomain_list, timeout=timeout))
@@ -1,5 +1,36 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+
+from . import SESSION
+
+# Signature substring -> result bucket. Add new detections here; the scan
+# below stays a single pass over the body however long this grows.
+SIGNATURES = {
+    "React": "frameworks",
+    "Angular": "frameworks",
+    "jQuery": "libraries",
+}
+
+try:
+    import ahocorasick  # optional; single-pass multi-pattern scan
+
+    _AC = ahocorasick.Automaton()
+    for _tech, _cat in SIGNATURES.items():
+        _AC.add_word(_tech, (_cat, _tech))
+    _AC.make_automaton()
+except ImportError:
+    _AC = None
+
+# Fallback: one compiled alternation is still a single sweep, unlike a
+# chain of `sig in text` scans
+_FALLBACK_RE = re.compile("|".join(re.escape(t) for t in SIGNATURES))
+
+
+def _find_signatures(text):
+    """Return the set of (category, tech) pairs present in ``text``."""
+    if _AC is not None:
+        return {pair for _, pair in _AC.iter(text)}
+    return {(SIGNATURES[m], m) for m in _FALLBACK_RE.findall(text)}
+
 
 def identify_tech_stack(url):
     """
@@ -12,21 +43,19 @@ def identify_tech_stack(url):
         dict: A dictionary containing identified technologies.
     """
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = SESSION.get(url, timeout=6)
 
-        # Example: Check for common technologies in meta tags or scripts
         tech_stack = {
             "frameworks": [],
             "libraries": []
         }
 
-        if "React" in response.text:
-            tech_stack["frameworks"].append("React")
-        if "Angular" in response.text:
-            tech_stack["frameworks"].append("Angular")
-        if "jQuery" in response.text:
-            tech_stack["libraries"].append("jQuery")
+        # One linear sweep of the body finds every signature at once,
+        # instead of a full O(n) scan per technology
+        hits = _find_signatures(response.text)
+        for tech, cat in SIGNATURES.items():
+            if (cat, tech) in hits:
+                tech_stack[cat].append(tech)
 
         return tech_stack
     except Exception as e:
@@ -1,38 +1,82 @@
+import asyncio
+import functools
 import socket
 import whois
-import requests
+
+from . import SESSION
+
+async def perform_whois_lookup_async(domain, timeout: float = 6.0):
+    """
+    Perform a WHOIS lookup for the given domain.
+
+    WHOIS and RDAP are raced instead of tried serially: both are launched
+    at once and the first usable answer wins, so latency is min(whois,
+    rdap) rather than whois-then-fallback. The loser is cancelled.
+
+    Args:
+        domain (str): The domain name to look up.
+        timeout (float): RDAP request timeout in seconds.
+
+    Returns:
+        dict: A dictionary containing WHOIS (or RDAP) information.
+    """
+    async def _whois():
+        # whois module doesn't support timeout directly; rely on its internal defaults
+        whois_info = await asyncio.to_thread(whois.whois, domain)
+        data = whois_info if isinstance(whois_info, dict) else whois_info.__dict__
+        if not data or not any(data.values()):
+            raise ValueError(f"empty WHOIS answer for {domain}")
+        return data
+
+    async def _rdap():
+        # Thread-dispatched sync call: this coroutine also runs under
+        # short-lived asyncio.run loops, where the shared async client's
+        # connection pool would be stranded on a closed loop
+        resp = await asyncio.to_thread(
+            SESSION.get, f"https://rdap.org/domain/{domain}", timeout=max(2.0, timeout)
+        )
+        resp.raise_for_status()
+        return {"rdap": resp.json()}
+
+    pending = {asyncio.ensure_future(_whois()), asyncio.ensure_future(_rdap())}
+    errors = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    return task.result()
+                except Exception as e:
+                    errors.append(str(e))
+        return {"error": "; ".join(errors)}
+    finally:
+        for task in pending:
+            task.cancel()
+
 
 def perform_whois_lookup(domain, timeout: float = 6.0):
     """
     Perform a WHOIS lookup for the given domain.
 
+    Synchronous wrapper around perform_whois_lookup_async for callers
+    that are not running an event loop.
+
     Args:
         domain (str): The domain name to look up.
 
     Returns:
         dict: A dictionary containing WHOIS information.
     """
-    try:
-        # whois module doesn't support timeout directly; rely on its internal defaults
-        whois_info = whois.whois(domain)
-        if isinstance(whois_info, dict):
-            return whois_info
-        return whois_info.__dict__
-    except Exception as e:
-        # Fallback to RDAP if whois fails
-        try:
-            resp = requests.get(f"https://rdap.org/domain/{domain}", timeout=max(2.0, timeout))
-            if resp.ok:
-                data = resp.json()
-                return {"rdap": data, "whois_error": str(e)}
-            return {"error": str(e), "rdap_error": resp.text}
-        except Exception as re:
-            return {"error": str(e), "rdap_error": str(re)}
+    return asyncio.run(perform_whois_lookup_async(domain, timeout))
 
+@functools.lru_cache(maxsize=4096)
 def is_valid_domain(domain):
     """
     Validate the domain name.
 
+    Cached per process — validity rarely flips mid-run, so repeat checks
+    skip the blocking resolver call entirely.
+
     Args:
         domain (str): The domain name to validate.
 
@@ -44,3 +88,24 @@ def is_valid_domain(domain):
         return True
     except socket.error:
         return False
+
+
+async def is_valid_domain_async(domain):
+    """
+    Validate the domain name without blocking the event loop.
+
+    The sync variant stalls the loop for a full resolver round trip
+    (seconds on timeout); this dispatches getaddrinfo to the loop's
+    executor instead.
+
+    Args:
+        domain (str): The domain name to validate.
+
+    Returns:
+        bool: True if the domain is valid, False otherwise.
+    """
+    try:
+        await asyncio.get_running_loop().getaddrinfo(domain, None)
+        return True
+    except socket.gaierror:
+        return False
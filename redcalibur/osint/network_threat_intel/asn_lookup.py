@@ -1,9 +1,16 @@
 import requests
 
+from ...cache import disk_memoize
+
+
+@disk_memoize(ttl=86400)
 def lookup_asn(ip_address):
     """
     Perform an ASN lookup for the given IP address.
 
+    ASN assignments are near-static, so results persist on disk for 24h
+    (``cache=False`` refreshes).
+
     Args:
         ip_address (str): The IP address to analyze.
 
@@ -1,7 +1,14 @@
+from ...cache import disk_memoize
+
+
+@disk_memoize(ttl=86400)
 def perform_passive_dns_lookup(domain):
     """
     Perform a passive DNS lookup for the given domain.
 
+    Historical records accumulate slowly, so results persist on disk for
+    24h (``cache=False`` refreshes).
+
     Args:
         domain (str): The domain to analyze.
 
@@ -1,9 +1,55 @@
+import random
+import time
+
+import requests
 import shodan
+from requests.adapters import HTTPAdapter, Retry
+
+from ...cache import disk_memoize
+
+# Attempts per scan; transient APIErrors (rate limit, timeouts) back off
+# exponentially with jitter, anything else returns immediately
+_RETRIES = 3
+_TRANSIENT = ("rate limit", "timed out", "timeout", "unable to connect")
+
+# One pooled session shared by every Shodan client. Shodan throttles at
+# 1 req/sec and intermittently returns 429/5xx; transport-level retries
+# honor Retry-After so throttled sweeps back off instead of failing, and
+# the pool keeps the TLS connection to api.shodan.io alive across calls.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
+# Reuse one client (and its underlying HTTP session) per API key so
+# sequential scans don't pay a fresh TLS handshake each call.
+_CLIENTS = {}
+
+def _client(api_key):
+    api = _CLIENTS.get(api_key)
+    if api is None:
+        api = _CLIENTS[api_key] = shodan.Shodan(api_key)
+        # The SDK's default session has no retry policy; swap in the
+        # shared one (the key travels per-request, so sharing is safe)
+        api._session = _SESSION
+    return api
+
+@disk_memoize(ttl=86400)
 def perform_shodan_scan(api_key, target):
     """
     Perform a Shodan scan for the given target.
 
+    Host records change on day timescales and the free tier rate-limits
+    hard, so results persist on disk for 24h (``cache=False`` refreshes).
+
     Args:
         api_key (str): The Shodan API key.
         target (str): The target IP or domain to scan.
@@ -11,9 +57,15 @@ def perform_shodan_scan(api_key, target):
     Returns:
         dict: A dictionary containing Shodan scan results.
     """
-    try:
-        api = shodan.Shodan(api_key)
-        result = api.host(target)
-        return result
-    except shodan.APIError as e:
-        return {"error": str(e)}
+    api = _client(api_key)
+    delay = 1.0
+    for attempt in range(_RETRIES):
+        try:
+            return api.host(target)
+        except shodan.APIError as e:
+            message = str(e)
+            transient = any(marker in message.lower() for marker in _TRANSIENT)
+            if not transient or attempt + 1 == _RETRIES:
+                return {"error": message}
+            time.sleep(delay + random.random() * delay)
+            delay = min(delay * 2, 10.0)
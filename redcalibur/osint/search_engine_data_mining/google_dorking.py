@@ -1,6 +1,32 @@
-import requests
 from bs4 import BeautifulSoup
 
+from ..domain_infrastructure import SESSION
+
+try:
+    from selectolax.parser import HTMLParser  # optional C parser, ~25x html.parser
+except ImportError:
+    HTMLParser = None
+
+
+def _extract_links(html, num_results):
+    """Collect up to ``num_results`` absolute links from a results page."""
+    results = []
+    if HTMLParser is not None:
+        nodes = HTMLParser(html).css('a')
+        get = lambda node: node.attributes.get('href')  # noqa: E731
+    else:
+        nodes = BeautifulSoup(html, 'html.parser').find_all('a', href=True)
+        get = lambda node: node.get('href')  # noqa: E731
+
+    for node in nodes:
+        href = get(node)
+        if href and href.startswith('http'):
+            results.append(href)
+            if len(results) >= num_results:
+                break
+    return results
+
+
 def perform_google_dorking(query, num_results=10):
     """
     Perform Google Dorking for the given query.
@@ -17,15 +43,9 @@ def perform_google_dorking(query, num_results=10):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         url = f"https://www.google.com/search?q={query}&num={num_results}"
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        results = []
-        for link in soup.find_all('a'):
-            href = link.get('href')
-            if href and "http" in href:
-                results.append(href)
-
-        return results[:num_results]
+        # Shared keep-alive session: successive dork queries hit the same
+        # origin, so they reuse one TLS connection
+        response = SESSION.get(url, headers=headers, timeout=10)
+        return _extract_links(response.text, num_results)
     except Exception as e:
         return {"error": str(e)}
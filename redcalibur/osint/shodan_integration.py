@@ -1,53 +1,64 @@
+import logging
+
 import shodan
 
+from ..cache import TTL_SCAN, ttl_memoize
+# Shared per-key client cache: repeated queries reuse the client's HTTP
+# session instead of re-handshaking TLS to api.shodan.io on every call
+from .network_threat_intel.shodan_integration import _client
+
+logger = logging.getLogger(__name__)
+
 def search_shodan(api_key: str, query: str):
     """
     Search Shodan for a specific query.
 
+    Matches are logged at debug level with deferred %s formatting, so
+    callers that only want the returned dict pay no per-match I/O.
+
     :param api_key: Your Shodan API key
     :param query: The search query
     :return: Search results
     """
-    api = shodan.Shodan(api_key)
+    api = _client(api_key)
 
     try:
         results = api.search(query)
         total = results.get('total', 0) if isinstance(results, dict) else 0
-        print(f"Results found: {total}")
-        for result in results.get('matches', []) if isinstance(results, dict) else []:
-            ip = result.get('ip_str', 'unknown')
-            print(f"IP: {ip}")
-            banner = result.get('data')
-            if banner:
-                print(banner)
-            print("")
+        logger.debug("shodan search %r: %s results", query, total)
+        if logger.isEnabledFor(logging.DEBUG):
+            for result in results.get('matches', []) if isinstance(results, dict) else []:
+                logger.debug("shodan match %s", result.get('ip_str', 'unknown'))
         return results
 
     except shodan.APIError as e:
-        print(f"Error: {e}")
+        logger.error("shodan search failed: %s", e)
         return None
 
+@ttl_memoize(ttl=TTL_SCAN)
 def get_host_info(api_key: str, ip: str):
     """
     Get detailed information about a specific host.
 
+    Host records are memoized for TTL_SCAN seconds (keys are hashed, so
+    the API key never sits in memory in plaintext; errors return None and
+    are not cached, and ``cache=False`` forces a refresh).
+
     :param api_key: Your Shodan API key
     :param ip: The IP address of the host
     :return: Host information
     """
-    api = shodan.Shodan(api_key)
+    api = _client(api_key)
 
     try:
         host = api.host(ip)
-        print(f"IP: {host.get('ip_str', ip)}")
-        print(f"Organization: {host.get('org', 'n/a')}")
-        print(f"Operating System: {host.get('os', 'n/a')}")
-
-        for item in host.get('data', []) if isinstance(host, dict) else []:
-            print(f"Port: {item.get('port', 'n/a')}")
-            print(f"Banner: {item.get('data', '')}")
+        logger.debug(
+            "shodan host %s: org=%s os=%s ports=%s",
+            host.get('ip_str', ip), host.get('org', 'n/a'),
+            host.get('os', 'n/a'), len(host.get('data', [])),
+        )
         return host
 
     except shodan.APIError as e:
-        print(f"Error: {e}")
-        return None
\ No newline at end of file
+        logger.error("shodan host lookup failed: %s", e)
+        return None
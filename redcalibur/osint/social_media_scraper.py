@@ -1,10 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
+from . import SESSION
+
+# How much of the page to fetch: the result only carries a 500-char
+# snippet, so there is no reason to download (or parse) the full profile
+_SNIPPET_READ = 65536
 
 def scrape_social_media(platform, username):
     """
     Scrape social media profile information for the given username.
 
+    Only the first chunk of the response body is read; the profile HTML is
+    returned as a raw snippet instead of being parsed and re-serialized,
+    which previously tokenized the whole page just to slice 500 characters.
+
     Args:
         platform (str): The social media platform (e.g., 'twitter', 'instagram').
         username (str): The username to scrape.
@@ -14,18 +21,23 @@ def scrape_social_media(platform, username):
     """
     try:
         url = f"https://{platform}.com/{username}"
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=10, stream=True)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            # Extract profile information (this is platform-specific and may require adjustments)
+            response.encoding = response.encoding or "utf-8"
+            snippet = next(
+                response.iter_content(chunk_size=_SNIPPET_READ, decode_unicode=True),
+                "",
+            )
+            response.close()
             profile_info = {
                 "url": url,
                 "status": "Profile found",
-                "content": soup.prettify()[:500]  # Return the first 500 characters of the HTML
+                "content": snippet[:500]  # Return the first 500 characters of the HTML
             }
             return profile_info
         else:
+            response.close()
             return {"error": f"Profile not found (status code: {response.status_code})"}
     except Exception as e:
         return {"error": str(e)}
@@ -1,8 +1,16 @@
 import requests
 from urllib.parse import urlparse
 
+from . import SESSION
+
 DEFAULT_TIMEOUT = 6.0
 
+# Headers worth reporting; built once, and probed via CaseInsensitiveDict's
+# O(1) lookup instead of scanning (and lowercasing) every response header
+_INTERESTING_HEADERS = frozenset({
+    "server", "content-type", "x-frame-options", "strict-transport-security",
+})
+
 
 def normalize_url(url: str) -> str:
     if not url.lower().startswith(("http://", "https://")):
@@ -14,17 +22,22 @@ def basic_url_health(url: str) -> dict:
     """
     Lightweight URL health check used when VirusTotal is unavailable.
     Returns status code, final URL, and a small set of headers.
+
+    Probes with HEAD first (status and headers only, no body transfer);
+    servers that reject HEAD with 405 get a streaming GET whose body is
+    never read.
     """
     out = {"input": url}
     try:
         url = normalize_url(url)
-        resp = requests.get(url, timeout=DEFAULT_TIMEOUT, allow_redirects=True, headers={
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127 Safari/537.36"
-        })
+        resp = SESSION.head(url, timeout=DEFAULT_TIMEOUT, allow_redirects=True)
+        if resp.status_code == 405:
+            resp = SESSION.get(url, timeout=DEFAULT_TIMEOUT, allow_redirects=True, stream=True)
+            resp.close()
         out.update({
             "status": resp.status_code,
             "final_url": resp.url,
-            "headers": {k: v for k, v in resp.headers.items() if k.lower() in {"server", "content-type", "x-frame-options", "strict-transport-security"}},
+            "headers": {k: resp.headers[k] for k in _INTERESTING_HEADERS if k in resp.headers},
         })
     except requests.RequestException as e:
         out["error"] = str(e)
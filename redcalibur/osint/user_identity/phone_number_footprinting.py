@@ -1,10 +1,17 @@
+import functools
+
 import phonenumbers
 from phonenumbers import carrier, geocoder
 
+@functools.lru_cache(maxsize=4096)
 def footprint_phone_number(phone_number):
     """
     Perform footprinting on a phone number.
 
+    Results are memoized: carrier and geocoder lookups lazy-load per-region
+    metadata files on first use, so repeat queries for the same number skip
+    both the parse and the metadata access.
+
     Args:
         phone_number (str): The phone number to analyze.
 
@@ -23,3 +30,23 @@ def footprint_phone_number(phone_number):
         }
     except Exception as e:
         return {"error": str(e)}
+
+def footprint_many(phone_numbers):
+    """
+    Footprint a batch of phone numbers.
+
+    Numbers are processed in sorted order so entries sharing a country
+    prefix hit the same lazily-loaded carrier/geocoder region files
+    consecutively instead of thrashing between regions.
+
+    Args:
+        phone_numbers (list): The phone numbers to analyze.
+
+    Returns:
+        dict: Mapping of phone number to its footprint_phone_number result.
+    """
+    phone_numbers = list(phone_numbers)
+    for number in sorted(set(phone_numbers)):
+        footprint_phone_number(number)
+    # Second pass is pure cache hits, in the caller's original order
+    return {number: footprint_phone_number(number) for number in phone_numbers}
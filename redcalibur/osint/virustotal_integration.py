@@ -1,5 +1,11 @@
+import asyncio
+
 import requests
 
+from . import SESSION
+from ..cache import TTL_URLSCAN, ttl_memoize
+from ..http import get_async_client
+
 DEFAULT_TIMEOUT = 8.0
 
 def scan_url(api_key: str, url: str):
@@ -19,17 +25,22 @@ def scan_url(api_key: str, url: str):
     }
 
     try:
-        response = requests.post(vt_url, headers=headers, data=data, timeout=DEFAULT_TIMEOUT)
+        response = SESSION.post(vt_url, headers=headers, data=data, timeout=DEFAULT_TIMEOUT)
         if response.status_code == 200:
             return response.json()
         return {"error": "virustotal_error", "status": response.status_code, "body": response.text}
     except Exception as e:
         return {"error": str(e)}
 
+@ttl_memoize(ttl=TTL_URLSCAN)
 def get_url_report(api_key: str, url_id: str):
     """
     Get the scan report for a URL using the VirusTotal API.
 
+    Verdicts change slowly, so reports are memoized for TTL_URLSCAN
+    seconds (keys are hashed, so the API key never sits in memory in
+    plaintext; ``cache=False`` forces a refresh).
+
     :param api_key: Your VirusTotal API key
     :param url_id: The ID of the scanned URL
     :return: Report results
@@ -40,9 +51,78 @@ def get_url_report(api_key: str, url_id: str):
     }
 
     try:
-        response = requests.get(vt_url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        response = SESSION.get(vt_url, headers=headers, timeout=DEFAULT_TIMEOUT)
         if response.status_code == 200:
             return response.json()
         return {"error": "virustotal_error", "status": response.status_code, "body": response.text}
     except Exception as e:
         return {"error": str(e)}
+
+async def scan_url_async(api_key: str, url: str):
+    """
+    Scan a URL using the VirusTotal API over the shared pooled client.
+
+    :param api_key: Your VirusTotal API key
+    :param url: The URL to scan
+    :return: Scan results
+    """
+    client = get_async_client()
+    try:
+        response = await client.post(
+            "https://www.virustotal.com/api/v3/urls",
+            headers={"x-apikey": api_key},
+            data={"url": url},
+        )
+        if response.status_code == 200:
+            return response.json()
+        return {"error": "virustotal_error", "status": response.status_code, "body": response.text}
+    except Exception as e:
+        return {"error": str(e)}
+
+async def scan_urls_async(api_key: str, urls, concurrency: int = 4):
+    """
+    Scan several URLs concurrently over the shared pooled client.
+
+    In-flight submissions are bounded by a semaphore; the default of 4
+    matches the free-tier request budget so a large batch overlaps
+    requests without tripping the rate limiter.
+
+    :param api_key: Your VirusTotal API key
+    :param urls: Iterable of URLs to scan
+    :param concurrency: Maximum in-flight submissions
+    :return: dict mapping URL -> scan results
+    """
+    urls = list(urls)
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(u):
+        async with sem:
+            return await scan_url_async(api_key, u)
+
+    results = await asyncio.gather(*(_one(u) for u in urls))
+    return dict(zip(urls, results))
+
+def scan_urls_batch(api_key: str, urls, concurrency: int = 4):
+    """
+    Scan several URLs concurrently from synchronous code.
+
+    :param api_key: Your VirusTotal API key
+    :param urls: Iterable of URLs to scan
+    :param concurrency: Maximum in-flight submissions
+    :return: dict mapping URL -> scan results
+    """
+    urls = list(urls)
+
+    async def _run():
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(u):
+            # scan_url goes through the pooled sync SESSION; dispatching it
+            # to threads avoids binding the shared async client to this
+            # short-lived asyncio.run loop
+            async with sem:
+                return await asyncio.to_thread(scan_url, api_key, u)
+
+        return await asyncio.gather(*(_one(u) for u in urls))
+
+    return dict(zip(urls, asyncio.run(_run())))
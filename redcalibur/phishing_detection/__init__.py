@@ -12,7 +12,11 @@ Features:
 - Ensemble methods for improved accuracy
 """
 
+import hashlib
+import os
 import re
+from collections import OrderedDict
+
 import requests
 import numpy as np
 import pandas as pd
@@ -29,6 +33,10 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, confusion_matrix
 
 from ..ai_core import TransformerClassifier, RedTeamNeuralNet, AIModelConfig
+from .features import extract_numeric, url_to_bytes
+
+# Default location for persisted detector weights
+DEFAULT_MODEL_PATH = "models/phishing_detector.pt"
 
 
 @dataclass
@@ -67,18 +75,20 @@ class URLFeatureExtractor:
         """Extract comprehensive features from a URL."""
         parsed = urlparse(url)
         extracted = tldextract.extract(url)
-        
+        # Character-level counts come from the compiled numeric kernel
+        length, num_dots, num_special, entropy = extract_numeric(url_to_bytes(url))
+
         return URLFeatures(
-            length=len(url),
-            num_dots=url.count('.'),
+            length=int(length),
+            num_dots=int(num_dots),
             num_subdomains=len(extracted.subdomain.split('.')) if extracted.subdomain else 0,
-            num_special_chars=sum(1 for c in url if not c.isalnum() and c not in '.:/-'),
+            num_special_chars=int(num_special),
             has_ip=self._has_ip_address(parsed.netloc),
             has_suspicious_words=self._has_suspicious_words(url),
             domain_age=self._get_domain_age(extracted.domain),
             ssl_cert_valid=self._check_ssl_certificate(url),
             redirect_count=self._count_redirects(url),
-            entropy=self._calculate_entropy(url)
+            entropy=float(entropy)
         )
     
     def _has_ip_address(self, netloc: str) -> bool:
@@ -188,15 +198,74 @@ class AIPhishingDetector:
     - Ensemble methods for improved accuracy
     """
     
-    def __init__(self):
+    def __init__(self, cache: bool = True, cache_size: int = 100_000):
         self.feature_extractor = URLFeatureExtractor()
         self.neural_net = PhishingNeuralNetwork()
         self.transformer_model = None
         self.ensemble_model = RandomForestClassifier(n_estimators=100, random_state=42)
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        
+
         # Move neural network to device
         self.neural_net.to(self.device)
+
+        # LRU memoization of predictions keyed by URL hash; identical URLs
+        # skip feature extraction and the model forward entirely.
+        self._prediction_cache: Optional[OrderedDict] = OrderedDict() if cache else None
+        self._cache_size = cache_size
+
+    @staticmethod
+    def _cache_key(url: str) -> bytes:
+        return hashlib.blake2b(url.encode(), digest_size=16).digest()
+
+    def _compile_neural_net(self):
+        """Fuse layer dispatch into one graph where torch.compile is available."""
+        if hasattr(torch, "compile"):
+            try:
+                self.neural_net = torch.compile(self.neural_net, mode="reduce-overhead", dynamic=False)
+            except Exception:
+                pass  # unsupported backend; eager forward still works
+
+    def quantize(self) -> "AIPhishingDetector":
+        """
+        Dynamically quantize the network's Linear layers to int8.
+
+        On CPU, int8 matmuls roughly double inference throughput and
+        quarter the weight memory. No-op on CUDA, where FP32/FP16 kernels
+        are faster than the CPU quantized ops.
+        """
+        if self.device.type != 'cpu':
+            return self
+        net = getattr(self.neural_net, "_orig_mod", self.neural_net)
+        self.neural_net = torch.ao.quantization.quantize_dynamic(
+            net, {nn.Linear}, dtype=torch.qint8
+        )
+        if self._prediction_cache is not None:
+            self._prediction_cache.clear()
+        return self
+
+    def save(self, path: str = DEFAULT_MODEL_PATH) -> str:
+        """Persist trained models so later runs can skip retraining."""
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        # Unwrap torch.compile's wrapper so the state dict keys stay stable
+        net = getattr(self.neural_net, "_orig_mod", self.neural_net)
+        torch.save({
+            'neural_net': net.state_dict(),
+            'ensemble': self.ensemble_model,
+        }, path)
+        return path
+
+    def load(self, path: str = DEFAULT_MODEL_PATH) -> "AIPhishingDetector":
+        """Load previously saved models and prepare them for inference."""
+        checkpoint = torch.load(path, map_location=self.device, weights_only=False)
+        self.neural_net.load_state_dict(checkpoint['neural_net'])
+        self.neural_net.to(self.device)
+        self.neural_net.eval()
+        if checkpoint.get('ensemble') is not None:
+            self.ensemble_model = checkpoint['ensemble']
+        self._compile_neural_net()
+        return self
         
     def initialize_transformer(self, model_name: str = "distilbert-base-uncased"):
         """Initialize transformer model for text analysis."""
@@ -263,6 +332,12 @@ class AIPhishingDetector:
         self.ensemble_model.fit(X_train, y_train)
         ensemble_accuracy = self.ensemble_model.score(X_test, y_test)
         print(f'Ensemble Model Test Accuracy: {ensemble_accuracy:.4f}')
+
+        # Retraining invalidates any memoized predictions
+        if self._prediction_cache is not None:
+            self._prediction_cache.clear()
+
+        self._compile_neural_net()
     
     def predict_url(self, url: str) -> Dict[str, any]:
         """
@@ -271,6 +346,13 @@ class AIPhishingDetector:
         Returns:
             Dictionary with predictions from different models
         """
+        if self._prediction_cache is not None:
+            key = self._cache_key(url)
+            cached = self._prediction_cache.get(key)
+            if cached is not None:
+                self._prediction_cache.move_to_end(key)
+                return cached
+
         # Extract features
         url_features = self.feature_extractor.extract_features(url)
         feature_vector = self.feature_extractor.features_to_vector(url_features)
@@ -284,7 +366,7 @@ class AIPhishingDetector:
         # Neural network prediction
         feature_tensor = torch.FloatTensor(feature_vector).unsqueeze(0).to(self.device)
         self.neural_net.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             nn_output = self.neural_net(feature_tensor)
             nn_probs = torch.nn.functional.softmax(nn_output, dim=1)
             nn_prediction = torch.argmax(nn_probs, dim=1).item()
@@ -325,9 +407,64 @@ class AIPhishingDetector:
                 results['predictions']['ensemble']['confidence']
             ])
         }
-        
+
+        if self._prediction_cache is not None:
+            self._prediction_cache[key] = results
+            if len(self._prediction_cache) > self._cache_size:
+                self._prediction_cache.popitem(last=False)
+
         return results
     
+    def predict_urls(self, urls: List[str]) -> List[Dict[str, any]]:
+        """
+        Predict a batch of URLs with a single neural-network forward pass.
+
+        Returns:
+            List of result dictionaries, one per URL, matching predict_url's
+            neural_network/ensemble output shape.
+        """
+        url_features = [self.feature_extractor.extract_features(url) for url in urls]
+        vectors = np.array([self.feature_extractor.features_to_vector(f) for f in url_features])
+
+        feature_tensor = torch.FloatTensor(vectors).to(self.device)
+        self.neural_net.eval()
+        with torch.inference_mode():
+            nn_output = self.neural_net(feature_tensor)
+            nn_probs = torch.nn.functional.softmax(nn_output, dim=1)
+            nn_predictions = torch.argmax(nn_probs, dim=1)
+            nn_confidences = torch.max(nn_probs, dim=1)[0]
+
+        ensemble_preds = self.ensemble_model.predict(vectors)
+        ensemble_probas = self.ensemble_model.predict_proba(vectors)
+
+        results = []
+        for i, url in enumerate(urls):
+            nn_result = {
+                'prediction': int(nn_predictions[i].item()),
+                'confidence': float(nn_confidences[i].item()),
+                'probabilities': nn_probs[i].cpu().numpy().tolist()
+            }
+            ensemble_result = {
+                'prediction': ensemble_preds[i],
+                'confidence': max(ensemble_probas[i]),
+                'probabilities': ensemble_probas[i].tolist()
+            }
+            predictions = [nn_result['prediction'], ensemble_result['prediction']]
+            final_prediction = max(set(predictions), key=predictions.count)
+            results.append({
+                'url': url,
+                'features': url_features[i],
+                'predictions': {
+                    'neural_network': nn_result,
+                    'ensemble': ensemble_result
+                },
+                'final_prediction': {
+                    'is_phishing': bool(final_prediction),
+                    'confidence': np.mean([nn_result['confidence'], ensemble_result['confidence']])
+                }
+            })
+        return results
+
     def analyze_website_content(self, url: str) -> Dict[str, any]:
         """Analyze website content for phishing indicators."""
         try:
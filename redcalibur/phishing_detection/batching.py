@@ -0,0 +1,70 @@
+"""
+Request-coalescing batcher for phishing inference.
+
+Under concurrent load each caller would otherwise trigger its own
+neural-network forward pass. BatchedPredictor collects requests that
+arrive within a small window and runs one batched forward over the
+stacked feature tensor, so kernel launch and matmul cost is amortized
+across the batch while per-request latency stays bounded by the window.
+"""
+
+import asyncio
+
+
+class BatchedPredictor:
+    """Coalesce concurrent predict() calls into batched detector runs."""
+
+    def __init__(self, detector, max_batch_size: int = 32, window: float = 0.005):
+        self.detector = detector
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        """Start the background batching loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self):
+        """Cancel the background loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, url: str):
+        """Queue a URL for prediction and await its result."""
+        self.start()
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((url, fut))
+        return await fut
+
+    async def _loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first item, then drain for up to `window` seconds
+            items = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(items) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            urls = [url for url, _ in items]
+            try:
+                results = await asyncio.to_thread(self.detector.predict_urls, urls)
+                for (_, fut), result in zip(items, results):
+                    if not fut.done():
+                        fut.set_result(result)
+            except Exception as e:
+                for _, fut in items:
+                    if not fut.done():
+                        fut.set_exception(e)
@@ -2,10 +2,20 @@ import pytest
 import os
 from unittest.mock import patch, MagicMock
 from redcalibur.osint.shodan_integration import search_shodan, get_host_info
+from redcalibur.osint.network_threat_intel.shodan_integration import _CLIENTS
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# _client memoizes Shodan clients per API key; clear the cache around each
+# test so a client built under one test's patched constructor never leaks
+# into the next
+@pytest.fixture(autouse=True)
+def fresh_shodan_clients():
+    _CLIENTS.clear()
+    yield
+    _CLIENTS.clear()
+
 # Fixture to get the real API key from .env
 @pytest.fixture
 def shodan_api_key():
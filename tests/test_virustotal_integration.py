@@ -10,7 +10,7 @@ load_dotenv()
 def virustotal_api_key():
     return os.getenv("VIRUSTOTAL_API_KEY")
 
-@patch('requests.post')
+@patch('redcalibur.osint.SESSION.post')
 def test_scan_url_mocked(mock_post, virustotal_api_key):
     """Test VirusTotal URL scan with a mocked API."""
     mock_response = MagicMock()
@@ -22,7 +22,7 @@ def test_scan_url_mocked(mock_post, virustotal_api_key):
     assert scan_results is not None
     assert 'data' in scan_results
 
-@patch('requests.get')
+@patch('redcalibur.osint.SESSION.get')
 def test_get_url_report_mocked(mock_get, virustotal_api_key):
     """Test VirusTotal URL report with a mocked API."""
     mock_response = MagicMock()